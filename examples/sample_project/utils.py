@@ -3,10 +3,14 @@ Utility functions for the sample project.
 """
 
 import hashlib
+import re
 import secrets
 from datetime import datetime, timedelta
 from typing import Optional
 
+_sha256 = hashlib.sha256
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
 
 def hash_password(password: str) -> str:
     """
@@ -18,7 +22,7 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password
     """
-    return hashlib.sha256(password.encode()).hexdigest()
+    return _sha256(password.encode("utf-8")).hexdigest()
 
 
 def generate_token() -> str:
@@ -41,10 +45,7 @@ def validate_email(email: str) -> bool:
     Returns:
         True if email is valid format
     """
-    import re
-
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.match(email) is not None
 
 
 class DateHelper:
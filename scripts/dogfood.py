@@ -3,40 +3,112 @@
 Dogfooding script: Run DocGenie on itself to generate its own documentation.
 """
 
-from pathlib import Path
+import argparse
+import hashlib
+import json
 import sys
+from pathlib import Path
+from typing import Any
+
+from git import GitCommandError, InvalidGitRepositoryError, NoSuchPathError, Repo
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from docgenie import __version__
 from docgenie.core import CodebaseAnalyzer
 from docgenie.generator import ReadmeGenerator
 from docgenie.html_generator import HTMLGenerator
 from docgenie.logging import configure_logging, get_logger
 
+OUTPUT_FILES = ("DOGFOOD_README.md", "DOGFOOD_DOCS.html")
+ANALYSIS_CACHE = Path(".docgenie") / "dogfood_analysis.json"
+
+
+def analysis_cache_key(repo_root: Path) -> str | None:
+    """
+    Key the analysis on HEAD plus the current content of every dirty file.
+
+    Paths the script itself writes (.docgenie/ and the generated outputs) are
+    left out so a run does not invalidate its own cache.
+
+    Returns:
+        Hex digest, or None when the repository state cannot be read
+    """
+    try:
+        repo = Repo(repo_root)
+        head = repo.git.rev_parse("HEAD")
+        status = repo.git.status("--porcelain", "-z", "--untracked-files=all")
+    except (InvalidGitRepositoryError, NoSuchPathError, GitCommandError):
+        return None
 
-def main() -> int:
+    digest = hashlib.sha256(f"{__version__}\0{head}\0".encode())
+    records = iter(status.split("\0"))
+    for record in records:
+        status_code, rel_path = record[:2], record[3:]
+        # A rename or copy is followed by a bare record holding its source path
+        source = next(records, "") if "R" in status_code or "C" in status_code else ""
+        if not rel_path or rel_path.startswith(".docgenie/") or rel_path in OUTPUT_FILES:
+            continue
+        digest.update(f"{record}\0{source}".encode())
+        file_path = repo_root / rel_path
+        if file_path.is_file():
+            digest.update(file_path.read_bytes())
+    return digest.hexdigest()
+
+
+def load_cached_analysis(cache_path: Path, key: str | None) -> dict[str, Any] | None:
+    """Return the stored analysis when it was produced for the same key."""
+    if key is None or not cache_path.exists():
+        return None
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return None
+    if cached.get("key") != key:
+        return None
+    return cached.get("analysis")
+
+
+def main(argv: list[str] | None = None) -> int:
     """Run DocGenie on itself."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Re-analyze even if the repository is unchanged"
+    )
+    args = parser.parse_args(argv)
+
     configure_logging(verbose=True)
     logger = get_logger(__name__)
 
     repo_root = Path(__file__).parent.parent
     logger.info("Dogfooding: Running DocGenie on itself", path=str(repo_root))
 
-    # Analyze the DocGenie codebase
-    analyzer = CodebaseAnalyzer(
-        str(repo_root),
-        ignore_patterns=[
-            "*.egg-info",
-            ".docgenie",
-            "examples/*",
-            "docs/*",
-        ],
-        enable_tree_sitter=False,  # Don't require tree-sitter
-    )
+    cache_path = repo_root / ANALYSIS_CACHE
+    cache_key = None if args.no_cache else analysis_cache_key(repo_root)
+    analysis_data = load_cached_analysis(cache_path, cache_key)
+    if analysis_data is not None:
+        logger.info("Repository unchanged since last run, reusing analysis", cache=str(cache_path))
+    else:
+        # Analyze the DocGenie codebase
+        analyzer = CodebaseAnalyzer(
+            str(repo_root),
+            ignore_patterns=[
+                "*.egg-info",
+                ".docgenie",
+                "examples/*",
+                "docs/*",
+            ],
+            enable_tree_sitter=False,  # Don't require tree-sitter
+        )
 
-    logger.info("Starting analysis...")
-    analysis_data = analyzer.analyze()
+        logger.info("Starting analysis...")
+        analysis_data = analyzer.analyze()
+        if cache_key is not None:
+            cache_path.parent.mkdir(exist_ok=True)
+            cache_path.write_text(
+                json.dumps({"key": cache_key, "analysis": analysis_data}), encoding="utf-8"
+            )
 
     logger.info(
         "Analysis complete",
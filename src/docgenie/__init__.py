@@ -9,7 +9,23 @@ __version__ = "1.1.85"
 __author__ = "ch1kim0n1"
 __email__ = "vxk230059@utdallas.edu"
 
-from .core import CodebaseAnalyzer
-from .generator import ReadmeGenerator
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .core import CodebaseAnalyzer
+    from .generator import ReadmeGenerator
 
 __all__ = ["CodebaseAnalyzer", "ReadmeGenerator"]
+
+# Public names resolved on first access, so `import docgenie` stays cheap
+_LAZY_EXPORTS = {"CodebaseAnalyzer": ".core", "ReadmeGenerator": ".generator"}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -18,7 +18,7 @@ from .config import load_config
 from .core import CodebaseAnalyzer
 from .diff_engine import compute_git_diff_summary
 from .generator import ReadmeGenerator
-from .html_generator import HTMLGenerator
+from .html_generator import HTMLGenerator, resolve_markdown_backend
 from .index_store import IndexStore
 from .logging import configure_logging, get_logger
 from .pr_summary import render_pr_summary
@@ -61,6 +61,14 @@ def _validate_format(fmt: str) -> str:
     return target_formats
 
 
+def _validate_markdown_backend() -> str:
+    try:
+        return resolve_markdown_backend()
+    except ValueError as exc:
+        typer.echo(f"Invalid DOCGENIE_MD_BACKEND. {exc}")
+        raise typer.Exit(code=1) from exc
+
+
 def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
     merged = dict(base)
     for key, value in override.items():
@@ -167,8 +175,10 @@ def _render_outputs(
     )
 
     req_sections = required_sections if isinstance(required_sections, list) else None
+    # One generator for every Markdown render so derived project facts are reused
+    generator = ReadmeGenerator()
     if not analysis_data.get("readme_readiness"):
-        preview_readme = ReadmeGenerator().generate(analysis_data, None)
+        preview_readme = generator.generate(analysis_data, None)
         analysis_data["readme_readiness"] = evaluate_readme_readiness(
             preview_readme,
             analysis_data=analysis_data,
@@ -178,7 +188,6 @@ def _render_outputs(
 
     for output_format, output_path in outputs:
         if output_format == "markdown":
-            generator = ReadmeGenerator()
             initial_content = generator.generate(analysis_data, None)
             readiness = evaluate_readme_readiness(
                 initial_content,
@@ -251,6 +260,8 @@ def generate(  # noqa: PLR0913
     logger = get_logger(__name__)
 
     target_formats = _validate_format(fmt)
+    if target_formats != "markdown":
+        _validate_markdown_backend()
     console.rule("[bold cyan]DocGenie")
     logger.info("Starting documentation generation", path=str(path), format=target_formats)
 
@@ -476,7 +487,7 @@ def html_command(  # noqa: PLR0913
     tree_sitter: bool = typer.Option(True, "--tree-sitter/--no-tree-sitter"),
 ) -> None:
     """Convert README to HTML or generate HTML from codebase analysis."""
-    html_generator = HTMLGenerator()
+    html_generator = HTMLGenerator(_validate_markdown_backend())
     output_path = output
     if not output_path:
         output_path = (input_path.parent if source == "readme" else input_path) / "docs.html"
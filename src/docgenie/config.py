@@ -54,6 +54,8 @@ def get_default_config() -> dict[str, Any]:
             "parallelism": "auto",
             "hard_file_cap": 300000,
             "full_rescan_interval_runs": 20,
+            "include_contributors": True,
+            "cache_max_entries": 10000,
         },
         "monorepo": {
             "mode": "auto",
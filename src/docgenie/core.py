@@ -4,18 +4,28 @@ from __future__ import annotations
 
 import hashlib
 import json
+import mmap
 import os
 import re
+import shutil
+import sys
+import time
 from collections import Counter, defaultdict
-from collections.abc import Iterable
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import suppress
+from importlib import metadata
 from pathlib import Path
 from typing import Any
 
-import toml
 from pathspec import PathSpec
 
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+from . import __version__
 from .diff_engine import compute_git_diff_summary
 from .index_store import IndexStore
 from .models import AnalysisResult
@@ -23,63 +33,205 @@ from .output_links import scan_output_links
 from .parsers import ParserRegistry
 from .review_engine import build_reviews
 from .utils import (
+    compile_ignore_patterns,
     extract_git_info,
     get_file_language,
     is_path_ignored_by_gitignore,
     is_probably_generated_file,
     is_website_project,
     load_gitignore_spec,
-    should_ignore_file,
 )
 
+_REQUIREMENT_SPEC_RE = re.compile(r"[<>=!]")
+_POM_ARTIFACT_RE = re.compile(rb"<artifactId>(.*?)</artifactId>")
+# A negated class stops at the first "]" like a lazy DOTALL scan, but without backtracking
+_SETUP_REQUIRES_RE = re.compile(rb"install_requires\s*=\s*\[([^\]]*)\]")
+_SETUP_DEP_RE = re.compile(rb"[\"']([^\"'>=<]+)")
+_GEM_NAME_RE = re.compile(r'gem\s+["\']([^"\']+)')
+# Heavy directories from DEFAULT_IGNORE_PATTERNS, pruned by name before any path checks
+_FAST_IGNORE_DIRS = frozenset(
+    {".git", "node_modules", "__pycache__", ".venv", "venv", "env", ".idea", ".vscode"}
+)
+# Bump when the shape of cached parse results changes
+_CACHE_SCHEMA_VERSION = 1
+# Files modified this recently are not trusted to stat-match the cache (see _stat_fields)
+_RACY_WINDOW_NS = 2_000_000_000
+# Below this many files to parse, analysis runs inline instead of starting a process pool
+_POOL_MIN_TASKS = 4
+# Upper bound on files per worker task; small repos use smaller batches to spread load
+_ANALYZE_BATCH_MAX = 64
+
 
 def _hash_file(path: Path) -> str:
-    digest = hashlib.sha256()
     with open(path, "rb") as handle:
-        for chunk in iter(lambda: handle.read(8192), b""):
+        if sys.version_info >= (3, 11):
+            # Reads and hashes in C without a per-chunk Python round trip
+            return hashlib.file_digest(handle, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
             digest.update(chunk)
     return digest.hexdigest()
 
 
 class CacheManager:
-    """Simple file-based cache to support incremental analysis."""
+    """File-based cache to support incremental analysis, sharded into one entry per source file."""
 
-    def __init__(self, root: Path):
+    def __init__(self, root: Path, max_entries: int = 10_000, enable_tree_sitter: bool = True):
         self.root = root
         self.cache_dir = root / ".docgenie"
         self.cache_dir.mkdir(exist_ok=True)
-        self.cache_file = self.cache_dir / "cache.json"
+        self.entries_dir = self.cache_dir / "entries"
+        self.stamp_file = self.cache_dir / "grammar-version"
+        self._check_stamp(_cache_stamp(enable_tree_sitter))
+        self.max_entries = max(1, max_entries)
+        # Only entries written during this run, oldest first; lookups read their own shard
+        # on demand, and the oldest pending entries are flushed once max_entries is reached.
         self._data: dict[str, dict[str, Any]] = {}
-        self._load()
+        self._last_read: tuple[str, dict[str, Any] | None] = ("", None)
 
-    def _load(self) -> None:
-        if self.cache_file.exists():
-            try:
-                self._data = json.loads(self.cache_file.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, OSError):
-                # Cache corrupted, start fresh
-                self._data = {}
+    def _check_stamp(self, stamp: str) -> None:
+        try:
+            current = self.stamp_file.read_text(encoding="utf-8")
+        except OSError:
+            current = None
+        if current == stamp:
+            return
+        # A parser, grammar or format change can alter any stored parse; start over
+        shutil.rmtree(self.entries_dir, ignore_errors=True)
+        # Caches from before sharding kept every entry in one cache.json
+        (self.cache_dir / "cache.json").unlink(missing_ok=True)
+        self.stamp_file.write_text(stamp, encoding="utf-8")
+
+    def _entry_path(self, key: str) -> Path:
+        # Parse results embed the file path, so shards are keyed by path rather than content
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.entries_dir / name[:2] / f"{name[2:]}.json"
+
+    def _read_entry(self, key: str) -> dict[str, Any] | None:
+        try:
+            record = json.loads(self._entry_path(key).read_bytes())
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+            # Missing or corrupted entry, treat as a miss
+            return None
+        return record if isinstance(record, dict) else None
+
+    def _write_entry(self, key: str, record: dict[str, Any]) -> None:
+        entry_path = self._entry_path(key)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        entry_path.write_text(json.dumps(record, separators=(",", ":")), encoding="utf-8")
 
     def persist(self) -> None:
-        self.cache_file.write_text(json.dumps(self._data, indent=2), encoding="utf-8")
+        # Warm runs that only hit the cache leave every shard untouched
+        for key, record in self._data.items():
+            self._write_entry(key, record)
+        self._data.clear()
+
+    def _record(self, key: str) -> dict[str, Any] | None:
+        record = self._data.get(key)
+        if record is None:
+            # A stat miss is usually followed by a digest lookup for the same file
+            if self._last_read[0] == key:
+                return self._last_read[1]
+            record = self._read_entry(key)
+            self._last_read = (key, record)
+        return record
+
+    def _put(self, key: str, record: dict[str, Any]) -> None:
+        if self._last_read[0] == key:
+            self._last_read = ("", None)
+        self._data.pop(key, None)
+        self._data[key] = record
+        if len(self._data) > self.max_entries:
+            oldest = next(iter(self._data))
+            self._write_entry(oldest, self._data.pop(oldest))
 
     def get(self, path: Path, digest: str) -> dict[str, Any] | None:
-        record = self._data.get(str(path))
+        record = self._record(str(path))
         if record and record.get("hash") == digest:
             return record.get("parse")
         return None
 
-    def set(self, path: Path, digest: str, parse_result: dict[str, Any], language: str) -> None:
+    def get_unchanged(self, path: Path, stat: os.stat_result) -> dict[str, Any] | None:
+        """Return the cached parse when size and mtime match the recorded stat, without hashing."""
+        record = self._record(str(path))
+        if (
+            record
+            and record.get("mtime_ns") == stat.st_mtime_ns
+            and record.get("size") == stat.st_size
+        ):
+            return record.get("parse")
+        return None
+
+    def update_stat(self, path: Path, stat: os.stat_result) -> None:
+        """Record a new stat for an entry whose content was confirmed unchanged."""
+        key = str(path)
+        record = self._record(key)
+        if record:
+            self._put(key, {**record, **_stat_fields(stat)})
+
+    def set(
+        self,
+        path: Path,
+        digest: str,
+        parse_result: dict[str, Any],
+        language: str,
+        stat: os.stat_result | None = None,
+    ) -> None:
         parse_result = dict(parse_result)
         parse_result["language"] = language
-        self._data[str(path)] = {"hash": digest, "parse": parse_result}
+        record: dict[str, Any] = {"hash": digest, "parse": parse_result}
+        if stat is not None:
+            record.update(_stat_fields(stat))
+        self._put(str(path), record)
+
+
+def _cache_stamp(enable_tree_sitter: bool) -> str:
+    """Describe everything besides file content that shapes a cached parse."""
+    lines = [
+        f"docgenie {__version__}",
+        f"schema {_CACHE_SCHEMA_VERSION}",
+        f"tree-sitter-enabled {enable_tree_sitter}",
+    ]
+    for dist in ("tree-sitter", "tree-sitter-language-pack"):
+        try:
+            version = metadata.version(dist)
+        except metadata.PackageNotFoundError:
+            version = "missing"
+        lines.append(f"{dist} {version}")
+    return "\n".join(lines) + "\n"
+
+
+def _stat_fields(stat: os.stat_result) -> dict[str, int]:
+    # Like git's racy-clean check: an edit within the mtime granularity of this run could
+    # leave size and mtime unchanged, so very fresh files are confirmed by digest next time.
+    if time.time_ns() - stat.st_mtime_ns < _RACY_WINDOW_NS:
+        return {}
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+_WORKER_REGISTRIES: dict[bool, ParserRegistry] = {}
+
+
+def _worker_registry(enable_tree_sitter: bool) -> ParserRegistry:
+    """Return the parser registry for this process, building it on first use."""
+    registry = _WORKER_REGISTRIES.get(enable_tree_sitter)
+    if registry is None:
+        registry = ParserRegistry(enable_tree_sitter=enable_tree_sitter)
+        _WORKER_REGISTRIES[enable_tree_sitter] = registry
+    return registry
+
+
+def _init_analysis_worker(enable_tree_sitter: bool) -> None:
+    """Build the worker's parser registry before the first batch arrives."""
+    _worker_registry(enable_tree_sitter)
 
 
 def _analyze_file_task(
-    payload: tuple[str, list[str], bool],
+    payload: tuple[str, list[str], bool, str],
+    parser_registry: ParserRegistry | None = None,
 ) -> tuple[str, str, dict[str, Any] | None, str]:
-    """Worker for concurrent file analysis."""
-    file_path_str, ignore_patterns, enable_tree_sitter = payload
+    """Worker for concurrent file analysis; the digest was already computed by the caller."""
+    file_path_str, ignore_patterns, enable_tree_sitter, file_hash = payload
     _ = ignore_patterns
     file_path = Path(file_path_str)
     language = get_file_language(file_path)
@@ -91,18 +243,44 @@ def _analyze_file_task(
     except (UnicodeDecodeError, PermissionError):
         return file_path_str, language, None, ""
 
-    file_hash = _hash_file(file_path)
-    parser_registry = ParserRegistry(enable_tree_sitter=enable_tree_sitter)
+    if parser_registry is None:
+        parser_registry = _worker_registry(enable_tree_sitter)
     parse_result = parser_registry.parse(content, file_path, language)
     return file_path_str, language, parse_result.to_public_dict(), file_hash
 
 
+def _analyze_batch(
+    payloads: list[tuple[str, list[str], bool, str]],
+) -> list[tuple[str, str, dict[str, Any] | None, str]]:
+    """Worker analyzing a batch of files with the process-wide parser registry."""
+    if not payloads:
+        return []
+    parser_registry = _worker_registry(payloads[0][2])
+    return [_analyze_file_task(payload, parser_registry) for payload in payloads]
+
+
+def _entry_stat(entry: os.DirEntry[str]) -> os.stat_result | None:
+    try:
+        return entry.stat()
+    except OSError:
+        return None
+
+
+def _parse_manifest(item: tuple[str, Callable[[Path], Any], Path]) -> Any:
+    _filename, parser, file_path = item
+    try:
+        return parser(file_path)
+    except (OSError, ValueError, KeyError, tomllib.TOMLDecodeError):
+        # Silently skip malformed dependency files
+        return None
+
+
 class CodebaseAnalyzer:
     """
     Analyzes a codebase to extract comprehensive information for documentation generation.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0915
         self,
         root_path: str,
         ignore_patterns: list[str] | None = None,
@@ -110,6 +288,7 @@ class CodebaseAnalyzer:
         config: dict[str, Any] | None = None,
     ):
         self.root_path = Path(root_path).resolve()
+        self._root_prefix = os.path.join(str(self.root_path), "")
         self.ignore_patterns = ignore_patterns or []
         self.enable_tree_sitter = enable_tree_sitter
         self.config = config or {}
@@ -129,10 +308,21 @@ class CodebaseAnalyzer:
         self.parallelism = analysis_config.get("parallelism", "auto")
         self.hard_file_cap = int(analysis_config.get("hard_file_cap", 300000))
         self.full_rescan_interval_runs = int(analysis_config.get("full_rescan_interval_runs", 20))
+        self.include_contributors = bool(analysis_config.get("include_contributors", True))
+        # Patterns are fixed for the analyzer's lifetime; match them without per-path setup
+        self._is_ignored = compile_ignore_patterns(self.ignore_patterns or None)
         self.gitignore_spec: PathSpec | None = (
             load_gitignore_spec(self.root_path) if self.use_gitignore else None
         )
-        self.cache = CacheManager(self.root_path)
+        try:
+            cache_max_entries = int(analysis_config.get("cache_max_entries", 10_000))
+        except (TypeError, ValueError):
+            cache_max_entries = 10_000
+        self.cache = CacheManager(
+            self.root_path,
+            max_entries=cache_max_entries,
+            enable_tree_sitter=enable_tree_sitter,
+        )
         self.index_store = IndexStore(self.root_path)
         self.active_run_id: int | None = None
 
@@ -145,8 +335,9 @@ class CodebaseAnalyzer:
         self.project_structure: dict[str, Any] = {}
         self.functions: list[dict[str, Any]] = []
         self.classes: list[dict[str, Any]] = []
-        self.imports: dict[str, set[str]] = defaultdict(set)
-        self.file_imports: dict[str, set[str]] = defaultdict(set)
+        # Accumulated as lists and deduplicated once in _compile_results
+        self.imports: dict[str, list[str]] = defaultdict(list)
+        self.file_imports: dict[str, list[str]] = defaultdict(list)
         self.documentation_files: list[str] = []
         self.config_files: list[str] = []
         self.git_info: dict[str, Any] = {}
@@ -158,20 +349,30 @@ class CodebaseAnalyzer:
         self.output_links: list[dict[str, Any]] = []
         self.readme_readiness: dict[str, Any] = {}
 
-    def _skip_reason(self, path: Path, *, is_dir: bool) -> str | None:
-        """Return a skip reason string if path should be skipped, else None."""
-        try:
-            rel = path.resolve().relative_to(self.root_path).as_posix()
-        except ValueError:
-            rel = path.as_posix()
+    def _skip_reason(
+        self, path: Path, *, is_dir: bool, entry: os.DirEntry[str] | None = None
+    ) -> str | None:
+        """Return a skip reason string if path should be skipped, else None.
+
+        ``entry`` is the path's listing from the tree walk, when there is one. The walk never
+        follows symlinked directories, so a non-symlink entry's path is already resolved and
+        its cached stat can be reused.
+        """
+        if entry is not None and not entry.is_symlink():
+            rel = entry.path[len(self._root_prefix) :].replace(os.sep, "/")
+        else:
+            try:
+                rel = path.resolve().relative_to(self.root_path).as_posix()
+            except ValueError:
+                rel = path.as_posix()
 
         reason: str | None = None
         if is_path_ignored_by_gitignore(rel, self.gitignore_spec, is_dir=is_dir):
             reason = "gitignore"
-        elif should_ignore_file(rel, self.ignore_patterns or None):
+        elif self._is_ignored(rel):
             reason = "ignore_pattern"
         elif not self.include_hidden and any(
-            part.startswith(".") for part in Path(rel).parts if part not in ("", ".")
+            part.startswith(".") for part in rel.split("/") if part not in ("", ".")
         ):
             reason = "hidden"
         elif (
@@ -182,14 +383,16 @@ class CodebaseAnalyzer:
             reason = "generated"
         elif (not is_dir) and self.max_file_size_kb is not None:
             try:
-                over_limit = path.stat().st_size > self.max_file_size_kb * 1024
-                reason = "size_limit" if over_limit else None
+                size = entry.stat().st_size if entry is not None else path.stat().st_size
+                reason = "size_limit" if size > self.max_file_size_kb * 1024 else None
             except OSError:
                 reason = "stat_error"
         return reason
 
-    def _should_skip_path(self, path: Path, *, is_dir: bool) -> bool:
-        reason = self._skip_reason(path, is_dir=is_dir)
+    def _should_skip_path(
+        self, path: Path, *, is_dir: bool, entry: os.DirEntry[str] | None = None
+    ) -> bool:
+        reason = self._skip_reason(path, is_dir=is_dir, entry=entry)
         if reason:
             self.skipped_reasons[reason] += 1
             return True
@@ -198,31 +401,37 @@ class CodebaseAnalyzer:
     def analyze(self) -> dict[str, Any]:  # noqa: PLR0915
         """Perform comprehensive analysis of the codebase."""
         self.active_run_id = self.index_store.start_run(mode="analyze")
-        self.git_info = extract_git_info(self.root_path)
-        files = list(self._iter_source_files())
-
-        tasks: list[tuple[str, list[str], bool]] = []
-        for file_path in files:
-            digest = _hash_file(file_path)
-            cached = self.cache.get(file_path, digest)
+        # Git info mostly waits on subprocesses, so overlap it with the file walk
+        with ThreadPoolExecutor(max_workers=1) as git_pool:
+            git_info = git_pool.submit(
+                extract_git_info, self.root_path, include_contributors=self.include_contributors
+            )
+            # One walk yields both the files to analyze and the project structure
+            files = self._scan_tree()
+            self.git_info = git_info.result()
+
+        tasks: list[tuple[str, list[str], bool, str]] = []
+        stats: dict[str, os.stat_result | None] = {}
+        for file_path, file_stat in files:
+            # Workers skip files without a known language; so do we, before hashing
+            if not get_file_language(file_path):
+                continue
+            cached, digest, stat = self._lookup_cache(file_path, file_stat)
             if cached:
                 self._apply_parsed_data(cached, file_path, cached_language=cached.get("language"))
                 continue
-            tasks.append((str(file_path), self.ignore_patterns, self.enable_tree_sitter))
-
-        if tasks:
-            with ProcessPoolExecutor() as executor:
-                futures = {
-                    executor.submit(_analyze_file_task, payload): payload[0] for payload in tasks
-                }
-                for future in as_completed(futures):
-                    file_path_str, language, parsed, file_hash = future.result()
-                    if not language or parsed is None:
-                        continue
-                    self._apply_parsed_data(parsed, Path(file_path_str), cached_language=language)
-                    self.cache.set(Path(file_path_str), file_hash, parsed, language)
-
-        self._analyze_project_structure()
+            stats[str(file_path)] = stat
+            tasks.append((str(file_path), self.ignore_patterns, self.enable_tree_sitter, digest))
+
+        for results in self._iter_task_results(tasks):
+            for file_path_str, language, parsed, file_hash in results:
+                if not language or parsed is None:
+                    continue
+                file_path = Path(file_path_str)
+                self._apply_parsed_data(parsed, file_path, cached_language=language)
+                stat = stats.get(file_path_str)
+                self.cache.set(file_path, file_hash, parsed, language, stat)
+
         self._detect_dependencies()
         self._run_diff_and_review()
         self._run_output_link_scan()
@@ -253,6 +462,46 @@ class CodebaseAnalyzer:
         self.cache.persist()
         return compiled.to_public_dict()
 
+    def _iter_task_results(
+        self, tasks: list[tuple[str, list[str], bool, str]]
+    ) -> Iterator[list[tuple[str, str, dict[str, Any] | None, str]]]:
+        """Yield analysis results batch by batch, in task order."""
+        if len(tasks) < _POOL_MIN_TASKS:
+            # Starting worker processes costs far more than parsing a handful of files
+            yield _analyze_batch(tasks)
+            return
+        # Batching amortises IPC and parser setup; a few batches per worker still
+        # balances uneven files. map() keeps walk order, so output is deterministic.
+        cpus = os.cpu_count() or 1
+        batch_size = min(_ANALYZE_BATCH_MAX, -(-len(tasks) // (4 * cpus)))
+        batches = [tasks[i : i + batch_size] for i in range(0, len(tasks), batch_size)]
+        with ProcessPoolExecutor(
+            max_workers=min(len(batches), cpus),
+            initializer=_init_analysis_worker,
+            initargs=(self.enable_tree_sitter,),
+        ) as executor:
+            yield from executor.map(_analyze_batch, batches)
+
+    def _lookup_cache(
+        self, file_path: Path, stat: os.stat_result | None = None
+    ) -> tuple[dict[str, Any] | None, str, os.stat_result | None]:
+        """Return the cached parse (if any), the file digest and its stat."""
+        if stat is None:
+            try:
+                stat = file_path.stat()
+            except OSError:
+                stat = None
+        # Unchanged size and mtime means unchanged content; only hash the rest
+        if stat is not None:
+            cached = self.cache.get_unchanged(file_path, stat)
+            if cached is not None:
+                return cached, "", stat
+        digest = _hash_file(file_path)
+        cached = self.cache.get(file_path, digest)
+        if cached and stat is not None:
+            self.cache.update_stat(file_path, stat)
+        return cached, digest, stat
+
     def __del__(self) -> None:
         with suppress(Exception):
             self.index_store.close()
@@ -304,11 +553,12 @@ class CodebaseAnalyzer:
         self.languages[language] += 1
         self.functions.extend(parsed.get("functions", []))
         self.classes.extend(parsed.get("classes", []))
-        for imp in parsed.get("imports", []):
-            self.imports[language].add(imp)
+        imports = parsed.get("imports", [])
+        if imports:
+            self.imports[language].extend(imports)
             rel_file = self._relative_file_path(file_path)
             if rel_file:
-                self.file_imports[rel_file].add(str(imp))
+                self.file_imports[rel_file].extend(map(str, imports))
 
     def _relative_file_path(self, file_path: Path) -> str:
         try:
@@ -316,31 +566,60 @@ class CodebaseAnalyzer:
         except ValueError:
             return file_path.as_posix()
 
-    def _iter_source_files(self) -> Iterable[Path]:
-        for root, dirs, files in os.walk(self.root_path):
-            root_path = Path(root)
-            dirs[:] = [d for d in dirs if not self._should_skip_path(root_path / d, is_dir=True)]
-            for file in files:
-                self.files_discovered += 1
-                file_path = root_path / file
-                if self._should_skip_path(file_path, is_dir=False):
-                    continue
-                yield file_path
+    def _scan_tree(self) -> list[tuple[Path, os.stat_result | None]]:
+        """Walk the tree once, recording the project structure and returning files to analyze.
 
-    def _analyze_project_structure(self) -> None:
+        Each file comes with the stat from its directory entry, so callers need not stat it again.
+        """
         structure: dict[str, Any] = {}
-        for root, dirs, files in os.walk(self.root_path):
-            root_path = Path(root)
-            dirs[:] = [d for d in dirs if not self._should_skip_path(root_path / d, is_dir=True)]
-            rel_path = os.path.relpath(root, self.root_path)
-            entry = {
-                "files": [
-                    f for f in files if not self._should_skip_path(root_path / f, is_dir=False)
-                ],
-                "dirs": dirs,
-            }
-            structure["root" if rel_path == "." else rel_path] = entry
+        source_files: list[tuple[Path, os.stat_result | None]] = []
+        discovered = 0
+        # Depth-first over os.scandir so entry names and d_type come straight from the
+        # directory listing; subdirectories are pushed in reverse to keep os.walk order.
+        pending: list[tuple[Path, str]] = [(self.root_path, "")]
+        while pending:
+            directory, rel_dir = pending.pop()
+            try:
+                with os.scandir(directory) as listing:
+                    entries = list(listing)
+            except OSError:
+                continue
+            files: list[str] = []
+            dirs: list[str] = []
+            subdirs: list[tuple[Path, str]] = []
+            for entry in entries:
+                # Names like __init__.py or tests repeat across the tree; share one copy
+                name = sys.intern(entry.name)
+                entry_path = directory / name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    discovered += 1
+                    if not self._should_skip_path(entry_path, is_dir=False, entry=entry):
+                        files.append(name)
+                        source_files.append((entry_path, _entry_stat(entry)))
+                    continue
+                if name in _FAST_IGNORE_DIRS:
+                    self.skipped_reasons["ignore_pattern"] += 1
+                    continue
+                if self._should_skip_path(entry_path, is_dir=True, entry=entry):
+                    continue
+                dirs.append(name)
+                if not entry.is_symlink():
+                    subdirs.append((entry_path, os.path.join(rel_dir, name)))
+            structure[rel_dir or "root"] = {"files": files, "dirs": dirs}
+            pending.extend(reversed(subdirs))
         self.project_structure = structure
+        self.files_discovered = discovered
+        return source_files
+
+    def _iter_source_files(self) -> Iterable[Path]:
+        return (file_path for file_path, _stat in self._scan_tree())
+
+    def _analyze_project_structure(self) -> None:
+        self._scan_tree()
 
     def _detect_dependencies(self) -> None:
         dependency_files = {
@@ -354,38 +633,46 @@ class CodebaseAnalyzer:
             "Gemfile": self._parse_gemfile,
         }
 
-        for filename, parser in dependency_files.items():
-            file_path = self.root_path / filename
-            if file_path.exists():
-                try:
-                    deps = parser(file_path)
-                    if deps:
-                        self.dependencies[filename] = deps
-                except (OSError, ValueError, KeyError, toml.TomlDecodeError):
-                    # Silently skip malformed dependency files
-                    continue
+        present = [
+            (filename, parser, self.root_path / filename)
+            for filename, parser in dependency_files.items()
+            if (self.root_path / filename).exists()
+        ]
+        if len(present) > 1:
+            # Manifests are independent; overlap their reads and parses
+            with ThreadPoolExecutor(max_workers=len(present)) as pool:
+                parsed = list(pool.map(_parse_manifest, present))
+        else:
+            parsed = [_parse_manifest(item) for item in present]
+        for (filename, _parser, _path), deps in zip(present, parsed, strict=True):
+            if deps:
+                self.dependencies[filename] = deps
 
     def _parse_requirements_txt(self, file_path: Path) -> list[str]:
         deps: list[str] = []
         for raw_line in file_path.read_text(encoding="utf-8").splitlines():
             line = raw_line.strip()
             if line and not line.startswith("#") and not line.startswith("-"):
-                dep = re.split(r"[<>=!]", line)[0].strip()
+                dep = _REQUIREMENT_SPEC_RE.split(line, maxsplit=1)[0].strip()
                 if dep:
                     deps.append(dep)
         return deps
 
     def _parse_package_json(self, file_path: Path) -> dict[str, list[str]]:
-        data = json.loads(file_path.read_text(encoding="utf-8"))
+        # Bytes go straight to the decoder, which also accepts a UTF-8 BOM
+        data = json.loads(file_path.read_bytes())
         deps: dict[str, list[str]] = {}
-        if "dependencies" in data:
-            deps["dependencies"] = list(data["dependencies"].keys())
-        if "devDependencies" in data:
-            deps["devDependencies"] = list(data["devDependencies"].keys())
+        if not isinstance(data, dict):
+            return deps
+        for section in ("dependencies", "devDependencies"):
+            entries = data.get(section)
+            if isinstance(entries, dict):
+                deps[section] = list(entries)
         return deps
 
     def _parse_pyproject_toml(self, file_path: Path) -> dict[str, Any]:
-        data = toml.load(file_path)
+        with open(file_path, "rb") as handle:
+            data = tomllib.load(handle)
         deps: dict[str, Any] = {}
         project = data.get("project", {})
         if project.get("dependencies"):
@@ -401,15 +688,15 @@ class CodebaseAnalyzer:
         return deps
 
     def _parse_setup_py(self, file_path: Path) -> list[str]:
-        content = file_path.read_text(encoding="utf-8")
-        install_requires_match = re.search(r"install_requires\s*=\s*\[(.*?)\]", content, re.DOTALL)
+        install_requires_match = _SETUP_REQUIRES_RE.search(file_path.read_bytes())
         if install_requires_match:
-            deps_str = install_requires_match.group(1)
-            return re.findall(r'["\']([^"\'>=<]+)', deps_str)
+            deps = _SETUP_DEP_RE.findall(install_requires_match.group(1))
+            return [dep.decode("utf-8") for dep in deps]
         return []
 
     def _parse_cargo_toml(self, file_path: Path) -> dict[str, list[str]]:
-        data = toml.load(file_path)
+        with open(file_path, "rb") as handle:
+            data = tomllib.load(handle)
         deps: dict[str, list[str]] = {}
         if "dependencies" in data:
             deps["dependencies"] = list(data["dependencies"].keys())
@@ -436,15 +723,19 @@ class CodebaseAnalyzer:
         return deps
 
     def _parse_pom_xml(self, file_path: Path) -> list[str]:
-        content = file_path.read_text(encoding="utf-8")
-        return re.findall(r"<artifactId>(.*?)</artifactId>", content)
+        # Large poms are scanned straight from the page cache; only matches are decoded
+        with (
+            open(file_path, "rb") as handle,
+            mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        ):
+            return [match.decode("utf-8") for match in _POM_ARTIFACT_RE.findall(mapped)]
 
     def _parse_gemfile(self, file_path: Path) -> list[str]:
         deps: list[str] = []
         for raw_line in file_path.read_text(encoding="utf-8").splitlines():
             line = raw_line.strip()
             if line.startswith("gem "):
-                match = re.search(r'gem\s+["\']([^"\']+)', line)
+                match = _GEM_NAME_RE.search(line)
                 if match:
                     deps.append(match.group(1))
         return deps
@@ -467,8 +758,10 @@ class CodebaseAnalyzer:
             project_structure=self.project_structure,
             functions=sorted_functions,
             classes=sorted_classes,
-            imports={lang: sorted(imps) for lang, imps in self.imports.items()},
-            file_imports={path: sorted(imps) for path, imps in self.file_imports.items()},
+            imports={lang: sorted(dict.fromkeys(imps)) for lang, imps in self.imports.items()},
+            file_imports={
+                path: sorted(dict.fromkeys(imps)) for path, imps in self.file_imports.items()
+            },
             documentation_files=self.documentation_files,
             config_files=self.config_files,
             git_info=self.git_info,
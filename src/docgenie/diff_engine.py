@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 from collections import defaultdict
 from pathlib import Path
 from typing import Any
@@ -34,12 +35,24 @@ def _safe_read_blob(repo: Repo, ref: str, rel_path: str) -> str:
     return text
 
 
-def _symbol_count(content: str, rel_path: str, parser_registry: ParserRegistry) -> int:
+def _symbol_count(
+    content: str,
+    rel_path: str,
+    parser_registry: ParserRegistry,
+    memo: dict[tuple[str, bytes], int] | None = None,
+) -> int:
     language = get_file_language(Path(rel_path))
     if not language or not content:
         return 0
+    # Renames, mode-only changes and vendored copies share content; parse each blob once.
+    key = (language, hashlib.blake2b(content.encode("utf-8", "surrogateescape")).digest())
+    if memo is not None and key in memo:
+        return memo[key]
     parsed = parser_registry.parse(content, Path(rel_path), language)
-    return len(parsed.functions) + len(parsed.classes)
+    count = len(parsed.functions) + len(parsed.classes)
+    if memo is not None:
+        memo[key] = count
+    return count
 
 
 def _default_from_ref(repo: Repo) -> str:
@@ -93,6 +106,7 @@ def compute_git_diff_summary(  # noqa: PLR0915
         pass
 
     parser_registry = ParserRegistry(enable_tree_sitter=enable_tree_sitter)
+    symbol_memo: dict[tuple[str, bytes], int] = {}
     files: list[dict[str, Any]] = []
     folders: dict[str, dict[str, Any]] = defaultdict(
         lambda: {
@@ -113,8 +127,8 @@ def compute_git_diff_summary(  # noqa: PLR0915
         added_lines, deleted_lines = numstat_map.get(rel_path, (0, 0))
         before = _safe_read_blob(repo, from_ref_resolved, item.a_path or rel_path)
         after = _safe_read_blob(repo, to_ref, item.b_path or rel_path)
-        symbol_delta = _symbol_count(after, rel_path, parser_registry) - _symbol_count(
-            before, item.a_path or rel_path, parser_registry
+        symbol_delta = _symbol_count(after, rel_path, parser_registry, symbol_memo) - _symbol_count(
+            before, item.a_path or rel_path, parser_registry, symbol_memo
         )
 
         if change_type == "A":
@@ -2,15 +2,113 @@
 README generation functionality for DocGenie.
 """
 
+from dataclasses import dataclass, fields
 from datetime import datetime
+from functools import cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Container, Dict, Iterable, List, TypeVar
 
-from jinja2 import Template
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache, Template
 
 from .logging import get_logger
 from .redaction import redact_text
-from .utils import create_directory_tree, get_project_type, is_website_project
+from .utils import (
+    create_directory_tree,
+    dependency_text,
+    get_project_type,
+    is_website_project,
+)
+
+# Keyword tables for the dependency heuristics: the first row with any keyword
+# present in the lower-cased dependency blob wins (purposes) or contributes (features).
+# Tables matched against root file names work the same way.
+_KeywordTable = tuple[tuple[tuple[str, ...], str], ...]
+_T = TypeVar("_T")
+
+_WEBSITE_PURPOSES: _KeywordTable = (
+    (("ecommerce", "shop", "cart"), "e-commerce website"),
+    (("blog", "cms", "wordpress"), "blog/content management website"),
+    (("portfolio", "gallery"), "portfolio website"),
+    (("dashboard", "admin"), "web dashboard application"),
+    (("doc", "guide"), "documentation website"),
+)
+
+_APPLICATION_PURPOSES: _KeywordTable = (
+    (("web", "http", "server"), "web application"),
+    (("api", "rest"), "API service"),
+    (("cli", "command"), "command-line tool"),
+    (("data", "analysis", "ml"), "data analysis tool"),
+    (("game",), "game"),
+)
+
+_FRAMEWORK_PHRASES: _KeywordTable = (
+    (("react",), " built with React"),
+    (("vue",), " built with Vue.js"),
+    (("angular",), " built with Angular"),
+    (("gatsby",), " powered by Gatsby"),
+    (("next",), " powered by Next.js"),
+)
+
+# Checked per dependency group, so the first group naming a framework decides.
+_FRONTEND_FRAMEWORKS: tuple[tuple[str, str], ...] = (
+    ("react", "React"),
+    ("vue", "Vue.js"),
+    ("angular", "Angular"),
+    ("svelte", "Svelte"),
+    ("ember", "Ember.js"),
+    ("backbone", "Backbone.js"),
+    ("jquery", "jQuery"),
+)
+
+# Config files, plus an optional dependency keyword, that identify a build system.
+_BUILD_SYSTEMS: tuple[tuple[tuple[str, ...], str | None, str], ...] = (
+    (("webpack.config.js",), None, "Webpack"),
+    (("vite.config.js", "vite.config.ts"), None, "Vite"),
+    (("rollup.config.js",), None, "Rollup"),
+    (("parcel.json",), "parcel", "Parcel"),
+    (("gatsby-config.js",), None, "Gatsby"),
+    (("next.config.js",), None, "Next.js"),
+)
+
+_STATIC_SITE_GENERATORS: _KeywordTable = (
+    (("_config.yml",), "Jekyll"),
+    (("hugo.toml", "hugo.yaml"), "Hugo"),
+    (("mkdocs.yml",), "MkDocs"),
+    (("docusaurus.config.js",), "Docusaurus"),
+)
+
+_WEBSITE_ENTRY_POINTS = ("index.html", "index.htm", "home.html", "main.html", "default.html")
+_ENTRY_POINT_FUNCTIONS = frozenset({"main", "run", "start", "execute"})
+
+_ASSET_DIR_HINTS = (
+    "public",
+    "static",
+    "assets",
+    "dist",
+    "build",
+    "css",
+    "js",
+    "images",
+    "img",
+    "fonts",
+)
+_MAX_ASSET_DIRS = 5
+
+_PYTHON_MANIFESTS = ("requirements.txt", "pyproject.toml", "setup.py")
+
+# Fallbacks when nothing specific was detected; callers receive fresh list copies
+_GENERIC_FEATURES = ("High performance", "Easy to use", "Modular design", "Configurable")
+_GENERIC_REQUIREMENTS = ("See installation instructions below",)
+
+_DEPENDENCY_FEATURES: _KeywordTable = (
+    (("web", "http"), "Web interface"),
+    (("api", "rest"), "REST API"),
+    (("database", "db", "sql"), "Database integration"),
+    (("test",), "Comprehensive testing"),
+    (("auth", "login"), "Authentication system"),
+    (("cache", "redis"), "Caching system"),
+)
 
 
 class ReadmeGenerator:
@@ -20,20 +118,29 @@ class ReadmeGenerator:
 
     def __init__(self) -> None:
         self.template = self._get_template()
-
-    def generate(self, analysis_data: Dict[str, Any], output_path: str | None = None) -> str:
+        # Derived facts for the most recently rendered analysis; the CLI renders the same
+        # analysis several times (readiness preview, then the real write)
+        self._facts: tuple[Dict[str, Any], _ProjectFacts] | None = None
+
+    def generate(
+        self,
+        analysis_data: Dict[str, Any],
+        output_path: str | None = None,
+        generated_date: str | None = None,
+    ) -> str:
         """
         Generate README content based on analysis data.
 
         Args:
             analysis_data: Results from CodebaseAnalyzer
             output_path: Optional path to save the README file
+            generated_date: Optional timestamp to stamp into the README; defaults to now
 
         Returns:
             Generated README content as string
         """
         # Prepare template context
-        context = self._prepare_context(analysis_data)
+        context = self._prepare_context(analysis_data, generated_date)
 
         # Render template
         readme_content = self.template.render(**context)
@@ -52,7 +159,7 @@ class ReadmeGenerator:
                 f.write(readme_content)
 
             # Check if website was detected and inform user
-            if is_website_project(analysis_data):
+            if context["is_website"]:
                 get_logger(__name__).info(
                     "Website detected; generated website-specific documentation",
                     output_path=output_path,
@@ -62,77 +169,76 @@ class ReadmeGenerator:
 
         return readme_content
 
-    def _prepare_context(self, analysis_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _prepare_context(
+        self, analysis_data: Dict[str, Any], generated_date: str | None = None
+    ) -> Dict[str, Any]:
         """Prepare template context from analysis data."""
-        # Basic project info
-        project_name = self._get_project_name(analysis_data)
-        project_type = get_project_type(analysis_data)
-        is_website = is_website_project(analysis_data)
-
         config = analysis_data.get("config", {})
-        template_customizations: dict[str, Any]
-        if isinstance(config, dict) and isinstance(config.get("template_customizations"), dict):
-            template_customizations = config["template_customizations"]
-        else:
-            template_customizations = {}
+        options = _TemplateOptions.from_config(config)
 
-        include_directory_tree = template_customizations.get("include_directory_tree", True)
-        include_api_docs = template_customizations.get("include_api_docs", True)
-        include_trust_badges = template_customizations.get("include_trust_badges", True)
+        # Basic project info, computed once and handed to the helpers that need it
+        facts = self._project_facts(analysis_data, options)
+        project_name = facts.project_name
+        is_website = facts.is_website
+        project_type = facts.project_type
 
         # Language statistics
         languages = analysis_data.get("languages", {})
         main_language = analysis_data.get("main_language", "unknown")
 
-        # Dependencies
+        # Dependencies, lower-cased once for every keyword heuristic below
         dependencies = analysis_data.get("dependencies", {})
+        dep_strings = facts.dep_strings
+        dep_blob = facts.dep_blob
 
         # Git information
         git_info = analysis_data.get("git_info", {})
 
         # Project structure
-        structure = analysis_data.get("project_structure", {})
-        directory_tree = create_directory_tree(structure) if include_directory_tree else None
+        directory_tree = facts.directory_tree
 
         # Code statistics
         functions = analysis_data.get("functions", [])
         classes = analysis_data.get("classes", [])
+        has_tests = facts.has_tests
+
         # Installation commands
         install_commands = self._generate_install_commands(analysis_data)
 
-        # Usage examples
-        usage_examples = self._generate_usage_examples(analysis_data)
-
-        quality_config = config.get("quality", {}) if isinstance(config, dict) else {}
-        quality_enabled = bool(quality_config.get("confidence_enabled", True))
-        min_confidence = str(quality_config.get("min_confidence_for_api_docs", "low")).lower()
-        quality = (
-            self._build_quality_report(analysis_data)
-            if quality_enabled
-            else {
-                "score": 100,
-                "confidence": "High",
-                "warnings": [],
-            }
+        # Usage examples (websites render build/deploy sections instead)
+        usage_examples = (
+            [] if is_website else self._generate_usage_examples(analysis_data, project_name)
         )
-        confidence_rank = {"low": 0, "medium": 1, "high": 2}
-        allow_api = confidence_rank.get(
-            str(quality["confidence"]).lower(), 0
-        ) >= confidence_rank.get(min_confidence, 0)
-
-        # API documentation
-        if include_api_docs and not is_website and allow_api:
-            api_docs = self._generate_api_docs(
-                functions, classes, config if isinstance(config, dict) else {}
+
+        # API documentation, gated on the quality report only when it would be rendered
+        api_docs: Dict[str, Any] = {"functions": [], "classes": []}
+        if options.include_api_docs and not is_website:
+            quality_config = config.get("quality", {}) if isinstance(config, dict) else {}
+            quality_enabled = bool(quality_config.get("confidence_enabled", True))
+            min_confidence = str(quality_config.get("min_confidence_for_api_docs", "low")).lower()
+            quality = (
+                self._build_quality_report(analysis_data, has_tests)
+                if quality_enabled
+                else {
+                    "score": 100,
+                    "confidence": "High",
+                    "warnings": [],
+                }
             )
-        else:
-            api_docs = {"functions": [], "classes": []}
+            confidence_rank = {"low": 0, "medium": 1, "high": 2}
+            allow_api = confidence_rank.get(
+                str(quality["confidence"]).lower(), 0
+            ) >= confidence_rank.get(min_confidence, 0)
+            if allow_api:
+                api_docs = self._generate_api_docs(
+                    functions, classes, config if isinstance(config, dict) else {}, options
+                )
 
         return {
             "project_name": project_name,
             "project_type": project_type,
             "is_website": is_website,
-            "description": self._generate_description(analysis_data),
+            "description": self._generate_description(analysis_data, dep_blob, is_website),
             "languages": languages,
             "main_language": main_language,
             "total_files": analysis_data.get("files_analyzed", 0),
@@ -144,23 +250,58 @@ class ReadmeGenerator:
             "install_commands": install_commands,
             "usage_examples": usage_examples,
             "api_docs": api_docs,
-            "features": self._extract_features(analysis_data),
+            "features": self._extract_features(analysis_data, dep_blob),
             "requirements": self._extract_requirements(dependencies),
-            "generated_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "has_tests": self._has_tests(analysis_data),
+            "generated_date": generated_date or _now_stamp(),
+            "has_tests": has_tests,
             "has_docs": len(analysis_data.get("documentation_files", [])) > 0,
             "config_files": analysis_data.get("config_files", []),
             "packages": analysis_data.get("packages", []),
             "run_metrics": analysis_data.get("run_metrics", {}),
-            "website_info": self._get_website_info(analysis_data) if is_website else None,
+            "website_info": (
+                self._get_website_info(analysis_data, dep_strings) if is_website else None
+            ),
             "diff_summary": analysis_data.get("diff_summary", {}),
             "folder_reviews": analysis_data.get("folder_reviews", []),
             "file_reviews": analysis_data.get("file_reviews", []),
             "output_links": analysis_data.get("output_links", []),
             "readme_readiness": analysis_data.get("readme_readiness", {}),
-            "trust": self._build_trust_badges(analysis_data, enabled=bool(include_trust_badges)),
+            "trust": self._build_trust_badges(analysis_data, enabled=options.include_trust_badges),
         }
 
+    def _project_facts(
+        self, analysis_data: Dict[str, Any], options: "_TemplateOptions"
+    ) -> "_ProjectFacts":
+        """Return the derived project facts, reusing them across renders of one analysis."""
+        # Analysis sections are treated as read-only between renders: replacing one (as the
+        # CLI does with readme_readiness) is detected, mutating one in place is not
+        sources = tuple(analysis_data.get(key) for key in _FACT_SOURCE_KEYS)
+        if self._facts is not None and self._facts[0] is analysis_data:
+            facts = self._facts[1]
+            if facts.include_directory_tree == options.include_directory_tree and all(
+                cached is current for cached, current in zip(facts.sources, sources, strict=True)
+            ):
+                return facts
+
+        is_website = is_website_project(analysis_data)
+        dep_strings = _dependency_strings(analysis_data.get("dependencies", {}))
+        structure = analysis_data.get("project_structure", {})
+        facts = _ProjectFacts(
+            sources=sources,
+            include_directory_tree=options.include_directory_tree,
+            project_name=self._get_project_name(analysis_data),
+            is_website=is_website,
+            project_type=get_project_type(analysis_data, is_website),
+            dep_strings=dep_strings,
+            dep_blob="\n".join(dep_strings),
+            has_tests=self._has_tests(analysis_data),
+            directory_tree=(
+                create_directory_tree(structure) if options.include_directory_tree else None
+            ),
+        )
+        self._facts = (analysis_data, facts)
+        return facts
+
     def generate_package_docs(
         self, analysis_data: Dict[str, Any], output_dir: Path
     ) -> dict[str, str]:
@@ -170,33 +311,38 @@ class ReadmeGenerator:
         if not isinstance(packages, list):
             return artifacts
         root_path = Path(str(analysis_data.get("root_path", ".")))
+        # Every package README in one batch carries the same timestamp
+        generated_date = _now_stamp()
         for pkg in packages:
             pkg_path = str(pkg.get("path", "."))
             if pkg_path == ".":
                 continue
             abs_pkg = root_path / pkg_path
+            pkg_prefix = str(abs_pkg)
             package_data = dict(analysis_data)
             package_data["project_name"] = abs_pkg.name
             package_data["functions"] = [
                 f
                 for f in analysis_data.get("functions", [])
-                if str(f.get("file", "")).startswith(str(abs_pkg))
+                if str(f.get("file", "")).startswith(pkg_prefix)
             ]
             package_data["classes"] = [
                 c
                 for c in analysis_data.get("classes", [])
-                if str(c.get("file", "")).startswith(str(abs_pkg))
+                if str(c.get("file", "")).startswith(pkg_prefix)
             ]
             package_data["files_analyzed"] = len(package_data["functions"]) + len(
                 package_data["classes"]
             )
             output_path = output_dir / pkg_path / "README.md"
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            content = self.generate(package_data, str(output_path))
+            content = self.generate(package_data, str(output_path), generated_date)
             artifacts[pkg_path] = content
         return artifacts
 
-    def _build_quality_report(self, analysis_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _build_quality_report(
+        self, analysis_data: Dict[str, Any], has_tests: bool | None = None
+    ) -> Dict[str, Any]:
         """Compute simple quality/confidence signals for generated docs."""
         files_analyzed = int(analysis_data.get("files_analyzed", 0) or 0)
         languages = analysis_data.get("languages", {})
@@ -233,7 +379,9 @@ class ReadmeGenerator:
         else:
             warnings.append("No dependency metadata files were detected.")
 
-        if self._has_tests(analysis_data):
+        if has_tests is None:
+            has_tests = self._has_tests(analysis_data)
+        if has_tests:
             score += 5
         else:
             warnings.append("No tests detected. Generated usage guidance may need manual review.")
@@ -266,62 +414,31 @@ class ReadmeGenerator:
 
         return "Project"
 
-    def _generate_description(self, analysis_data: Dict[str, Any]) -> str:
+    def _generate_description(
+        self,
+        analysis_data: Dict[str, Any],
+        dep_blob: str | None = None,
+        is_website: bool | None = None,
+    ) -> str:
         """Generate a project description based on analysis."""
         main_language = analysis_data.get("main_language", "unknown")
+        if dep_blob is None:
+            dep_blob = "\n".join(_dependency_strings(analysis_data.get("dependencies", {})))
+        if is_website is None:
+            is_website = is_website_project(analysis_data)
 
         # Check if it's a website
-        if is_website_project(analysis_data):
-            dependencies = analysis_data.get("dependencies", {})
-            dep_strings = [str(deps).lower() for deps in dependencies.values()]
-
+        if is_website:
             # Determine website type and purpose
-            if any("ecommerce" in deps or "shop" in deps or "cart" in deps for deps in dep_strings):
-                purpose = "e-commerce website"
-            elif any(
-                "blog" in deps or "cms" in deps or "wordpress" in deps for deps in dep_strings
-            ):
-                purpose = "blog/content management website"
-            elif any("portfolio" in deps or "gallery" in deps for deps in dep_strings):
-                purpose = "portfolio website"
-            elif any("dashboard" in deps or "admin" in deps for deps in dep_strings):
-                purpose = "web dashboard application"
-            elif any("doc" in deps or "guide" in deps for deps in dep_strings):
-                purpose = "documentation website"
-            else:
-                purpose = "modern web application"
+            purpose = _first_match(_WEBSITE_PURPOSES, dep_blob, "modern web application")
 
             # Add framework info if detected
-            framework_info = ""
-            if "react" in str(dependencies).lower():
-                framework_info = " built with React"
-            elif "vue" in str(dependencies).lower():
-                framework_info = " built with Vue.js"
-            elif "angular" in str(dependencies).lower():
-                framework_info = " built with Angular"
-            elif "gatsby" in str(dependencies).lower():
-                framework_info = " powered by Gatsby"
-            elif "next" in str(dependencies).lower():
-                framework_info = " powered by Next.js"
+            framework_info = _first_match(_FRAMEWORK_PHRASES, dep_blob, "")
 
             return f"A responsive {purpose}{framework_info} with modern features and user-friendly interface."
 
         # Non-website projects
-        dependencies = analysis_data.get("dependencies", {})
-        dep_strings = [str(deps).lower() for deps in dependencies.values()]
-
-        if any("web" in deps or "http" in deps or "server" in deps for deps in dep_strings):
-            purpose = "web application"
-        elif any("api" in deps or "rest" in deps for deps in dep_strings):
-            purpose = "API service"
-        elif any("cli" in deps or "command" in deps for deps in dep_strings):
-            purpose = "command-line tool"
-        elif any("data" in deps or "analysis" in deps or "ml" in deps for deps in dep_strings):
-            purpose = "data analysis tool"
-        elif any("game" in deps for deps in dep_strings):
-            purpose = "game"
-        else:
-            purpose = "application"
+        purpose = _first_match(_APPLICATION_PURPOSES, dep_blob, "application")
 
         return f"A {main_language.lower()} {purpose} with comprehensive functionality and modern architecture."
 
@@ -329,7 +446,7 @@ class ReadmeGenerator:
         """Generate installation commands based on project type."""
         commands = []
         structure = analysis_data.get("project_structure", {})
-        root_files = structure.get("root", {}).get("files", [])
+        root_files = frozenset(structure.get("root", {}).get("files", []))
 
         # Python projects
         if "requirements.txt" in root_files:
@@ -364,15 +481,19 @@ class ReadmeGenerator:
 
         return commands
 
-    def _generate_usage_examples(self, analysis_data: Dict[str, Any]) -> List[Dict[str, str]]:
+    def _generate_usage_examples(
+        self, analysis_data: Dict[str, Any], project_name: str | None = None
+    ) -> List[Dict[str, str]]:
         """Generate usage examples based on project analysis."""
         examples = []
+        if project_name is None:
+            project_name = self._get_project_name(analysis_data)
         main_language = analysis_data.get("main_language", "unknown")
         functions = analysis_data.get("functions", [])
         classes = analysis_data.get("classes", [])
 
         # Find main entry points
-        main_functions = [f for f in functions if f["name"] in ["main", "run", "start", "execute"]]
+        main_functions = [f for f in functions if f["name"] in _ENTRY_POINT_FUNCTIONS]
 
         if main_language == "python":
             if main_functions:
@@ -382,7 +503,7 @@ class ReadmeGenerator:
                 examples.append(
                     {
                         "title": f"Use the {class_name} class",
-                        "command": f"from {self._get_project_name(analysis_data).lower()} import {class_name}\n\ninstance = {class_name}()\nresult = instance.method()",
+                        "command": f"from {project_name.lower()} import {class_name}\n\ninstance = {class_name}()\nresult = instance.method()",
                     }
                 )
 
@@ -406,68 +527,66 @@ class ReadmeGenerator:
         return examples
 
     def _generate_api_docs(
-        self, functions: List[Dict], classes: List[Dict], config: Dict[str, Any]
+        self,
+        functions: List[Dict],
+        classes: List[Dict],
+        config: Dict[str, Any],
+        options: "_TemplateOptions | None" = None,
     ) -> Dict[str, Any]:
         """Generate API documentation from functions and classes."""
-        api_docs: Dict[str, Any] = {"functions": [], "classes": []}
-
-        max_funcs = config.get("template_customizations", {}).get("max_functions_documented", 10)
-
-        # Document main functions (limit to avoid overwhelming)
-        main_functions = [f for f in functions if not f["name"].startswith("_")][:max_funcs]
-        for func in main_functions:
-            doc = {
-                "name": func["name"],
-                "file": func.get("file", ""),
-                "line": func.get("line", 0),
-                "docstring": func.get("docstring", ""),
-                "args": func.get("args", []),
-                "decorators": func.get("decorators", []),
-            }
-            api_docs["functions"].append(doc)
-
-        # Document main classes (limit to avoid overwhelming)
-        main_classes = [c for c in classes if not c["name"].startswith("_")][:10]
-        for cls in main_classes:
-            doc = {
-                "name": cls["name"],
-                "file": cls.get("file", ""),
-                "line": cls.get("line", 0),
-                "docstring": cls.get("docstring", ""),
-                "methods": cls.get("methods", [])[:5],  # Limit methods shown
-                "bases": cls.get("bases", []),
-            }
-            api_docs["classes"].append(doc)
-
-        return api_docs
+        if options is None:
+            options = _TemplateOptions.from_config(config)
+        max_funcs = options.max_functions_documented
+
+        # Document main functions and classes (limit to avoid overwhelming)
+        public_functions = (f for f in functions if not f["name"].startswith("_"))
+        if isinstance(max_funcs, int) and max_funcs >= 0:
+            main_functions: Iterable[Dict] = islice(public_functions, max_funcs)
+        else:
+            # Negative limits keep their list-slice meaning (-1 drops the last function)
+            main_functions = list(public_functions)[:max_funcs]
+        main_classes = islice((c for c in classes if not c["name"].startswith("_")), 10)
+        return {
+            "functions": [
+                {
+                    "name": func["name"],
+                    "file": func.get("file", ""),
+                    "line": func.get("line", 0),
+                    "docstring": func.get("docstring", ""),
+                    "args": func.get("args", []),
+                    "decorators": func.get("decorators", []),
+                }
+                for func in main_functions
+            ],
+            "classes": [
+                {
+                    "name": cls["name"],
+                    "file": cls.get("file", ""),
+                    "line": cls.get("line", 0),
+                    "docstring": cls.get("docstring", ""),
+                    "methods": cls.get("methods", [])[:5],  # Limit methods shown
+                    "bases": cls.get("bases", []),
+                }
+                for cls in main_classes
+            ],
+        }
 
-    def _extract_features(self, analysis_data: Dict[str, Any]) -> List[str]:
+    def _extract_features(
+        self, analysis_data: Dict[str, Any], dep_blob: str | None = None
+    ) -> List[str]:
         """Extract key features from the codebase analysis."""
-        features = []
-        dependencies = analysis_data.get("dependencies", {})
         functions = analysis_data.get("functions", [])
         classes = analysis_data.get("classes", [])
 
         # Analyze dependencies for features
-        dep_strings = [str(deps).lower() for deps in dependencies.values()]
-
-        if any("web" in deps or "http" in deps for deps in dep_strings):
-            features.append("Web interface")
-
-        if any("api" in deps or "rest" in deps for deps in dep_strings):
-            features.append("REST API")
-
-        if any("database" in deps or "db" in deps or "sql" in deps for deps in dep_strings):
-            features.append("Database integration")
-
-        if any("test" in deps for deps in dep_strings):
-            features.append("Comprehensive testing")
-
-        if any("auth" in deps or "login" in deps for deps in dep_strings):
-            features.append("Authentication system")
+        if dep_blob is None:
+            dep_blob = "\n".join(_dependency_strings(analysis_data.get("dependencies", {})))
 
-        if any("cache" in deps or "redis" in deps for deps in dep_strings):
-            features.append("Caching system")
+        features = [
+            feature
+            for keywords, feature in _DEPENDENCY_FEATURES
+            if any(keyword in dep_blob for keyword in keywords)
+        ]
 
         if any("async" in f["name"] or f.get("is_async") for f in functions):
             features.append("Asynchronous processing")
@@ -480,12 +599,7 @@ class ReadmeGenerator:
 
         # Add generic features if none found
         if not features:
-            features = [
-                "High performance",
-                "Easy to use",
-                "Modular design",
-                "Configurable",
-            ]
+            features = list(_GENERIC_FEATURES)
 
         return features
 
@@ -497,7 +611,7 @@ class ReadmeGenerator:
             requirements.append("Node.js 14.0 or higher")
             requirements.append("npm or yarn")
 
-        if any(key in dependencies for key in ["requirements.txt", "pyproject.toml", "setup.py"]):
+        if any(key in dependencies for key in _PYTHON_MANIFESTS):
             requirements.append("Python 3.8 or higher")
             requirements.append("pip")
 
@@ -513,7 +627,7 @@ class ReadmeGenerator:
             requirements.append("Maven 3.6 or higher")
 
         if not requirements:
-            requirements.append("See installation instructions below")
+            requirements.extend(_GENERIC_REQUIREMENTS)
 
         return requirements
 
@@ -521,17 +635,15 @@ class ReadmeGenerator:
         """Check if the project has tests."""
         structure = analysis_data.get("project_structure", {})
 
-        # Check for test directories
-        for path in structure:
-            if "test" in path.lower() or "spec" in path.lower():
-                return True
+        # Check for test directories; a keyword can never straddle the newline separator,
+        # so one lower-cased blob answers the same question as a per-path scan
+        path_blob = "\n".join(structure).lower()
+        if "test" in path_blob or "spec" in path_blob:
+            return True
 
-        # Check for test files in root
+        # Check for test files in root (test_*.py and *_test.py contain "test" too)
         root_files = structure.get("root", {}).get("files", [])
-        for file in root_files:
-            if "test" in file.lower() or file.startswith("test_") or file.endswith("_test.py"):
-                return True
-        return False
+        return "test" in "\n".join(root_files).lower()
 
     def _build_trust_badges(
         self, analysis_data: Dict[str, Any], *, enabled: bool
@@ -618,7 +730,202 @@ class ReadmeGenerator:
 
     def _get_template(self) -> Template:
         """Get the README template."""
-        template_content = """# {{ project_name }}
+        return _compiled_readme_template()
+
+    def _get_website_info(
+        self, analysis_data: Dict[str, Any], dep_strings: tuple[str, ...] | None = None
+    ) -> Dict[str, Any]:
+        """Extract website-specific information."""
+        # Root file names are only ever probed for membership
+        files = frozenset(
+            analysis_data.get("project_structure", {}).get("root", {}).get("files", [])
+        )
+        structure = analysis_data.get("project_structure", {})
+        dependencies = analysis_data.get("dependencies", {})
+        if dep_strings is None:
+            dep_strings = _dependency_strings(dependencies)
+        dep_blob = "\n".join(dep_strings)
+
+        # Detect entry points
+        entry_points = [entry for entry in _WEBSITE_ENTRY_POINTS if entry in files]
+
+        # Detect build system
+        build_system = None
+        for config_files, dep_keyword, name in _BUILD_SYSTEMS:
+            if any(config in files for config in config_files) or (
+                dep_keyword is not None and dep_keyword in dep_blob
+            ):
+                build_system = name
+                break
+
+        # Detect static site generator
+        ssg = _first_match(_STATIC_SITE_GENERATORS, files, None)
+
+        # Find asset directories
+        asset_dirs = []
+        for path in structure:
+            lowered = path.lower()
+            if any(asset_dir in lowered for asset_dir in _ASSET_DIR_HINTS):
+                asset_dirs.append(path)
+                if len(asset_dirs) == _MAX_ASSET_DIRS:
+                    break
+
+        # Detect hosting/deployment info
+        deployment = []
+        if ".github/workflows" in structure or any("github" in path for path in structure):
+            deployment.append("GitHub Actions")
+        if "netlify.toml" in files or "_redirects" in files:
+            deployment.append("Netlify")
+        if "vercel.json" in files:
+            deployment.append("Vercel")
+        if "firebase.json" in files:
+            deployment.append("Firebase")
+        if "Dockerfile" in files:
+            deployment.append("Docker")
+
+        return {
+            "entry_points": entry_points,
+            "build_system": build_system,
+            "static_site_generator": ssg,
+            "asset_directories": asset_dirs,
+            "deployment_platforms": deployment,
+            "has_responsive_design": self._check_responsive_design(analysis_data, dep_blob),
+            "framework_detected": self._detect_frontend_framework(dependencies, dep_strings),
+        }
+
+    def _check_responsive_design(
+        self, analysis_data: Dict[str, Any], dep_blob: str | None = None
+    ) -> bool:
+        """Check if website uses responsive design patterns."""
+        # This is a simple heuristic - in practice you'd analyze CSS files
+        if dep_blob is None:
+            dep_blob = "\n".join(_dependency_strings(analysis_data.get("dependencies", {})))
+
+        responsive_indicators = [
+            "bootstrap",
+            "tailwind",
+            "bulma",
+            "foundation",
+            "semantic-ui",
+            "material-ui",
+            "chakra-ui",
+            "ant-design",
+        ]
+
+        return any(indicator in dep_blob for indicator in responsive_indicators)
+
+    def _detect_frontend_framework(
+        self, dependencies: Dict[str, Any], dep_strings: tuple[str, ...] | None = None
+    ) -> str | None:
+        """Detect the primary frontend framework."""
+        if dep_strings is None:
+            dep_strings = _dependency_strings(dependencies)
+        for deps_str in dep_strings:
+            for framework_key, framework_name in _FRONTEND_FRAMEWORKS:
+                if framework_key in deps_str:
+                    return framework_name
+
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class _TemplateOptions:
+    """``template_customizations`` knobs read once per render, with their defaults."""
+
+    include_directory_tree: bool = True
+    include_api_docs: bool = True
+    include_trust_badges: bool = True
+    max_functions_documented: int = 10
+
+    @classmethod
+    def from_config(cls, config: Any) -> "_TemplateOptions":
+        customizations = config.get("template_customizations") if isinstance(config, dict) else None
+        # Most runs customize nothing (the CLI only sets template_profile): share one instance
+        if not isinstance(customizations, dict) or customizations.keys().isdisjoint(
+            _TEMPLATE_OPTION_KEYS
+        ):
+            return _DEFAULT_TEMPLATE_OPTIONS
+        return cls(
+            include_directory_tree=bool(customizations.get("include_directory_tree", True)),
+            include_api_docs=bool(customizations.get("include_api_docs", True)),
+            include_trust_badges=bool(customizations.get("include_trust_badges", True)),
+            max_functions_documented=customizations.get("max_functions_documented", 10),
+        )
+
+
+_TEMPLATE_OPTION_KEYS = frozenset(field.name for field in fields(_TemplateOptions))
+_DEFAULT_TEMPLATE_OPTIONS = _TemplateOptions()
+
+# Analysis sections the derived project facts are computed from
+_FACT_SOURCE_KEYS = (
+    "project_name",
+    "git_info",
+    "root_path",
+    "project_structure",
+    "dependencies",
+    "languages",
+    "main_language",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _ProjectFacts:
+    """Values derived from an analysis that stay fixed while its sections are unchanged."""
+
+    sources: tuple[Any, ...]
+    include_directory_tree: bool
+    project_name: str
+    is_website: bool
+    project_type: str
+    dep_strings: tuple[str, ...]
+    dep_blob: str
+    has_tests: bool
+    directory_tree: str | None
+
+
+def _now_stamp() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _dependency_strings(dependencies: Dict[str, Any]) -> tuple[str, ...]:
+    """Lower-case each dependency group once; keyword heuristics are substring tests on these."""
+    return tuple(dependency_text(deps).lower() for deps in dependencies.values())
+
+
+def _first_match(table: _KeywordTable, haystack: Container[str], default: _T) -> str | _T:
+    """Return the label of the first table row with a keyword in ``haystack``."""
+    for keywords, label in table:
+        if any(keyword in haystack for keyword in keywords):
+            return label
+    return default
+
+
+@cache
+def _compiled_readme_template() -> Template:
+    # Compiling is the expensive part of Jinja. Every generator shares one template, and the
+    # per-user bytecode cache lets later processes load it without compiling at all.
+    # The template renders Markdown, so HTML autoescaping stays off as with a bare Template
+    env = Environment(  # noqa: S701  # nosec B701
+        loader=DictLoader({"README.md": _README_TEMPLATE}),
+        auto_reload=False,
+        bytecode_cache=_bytecode_cache(),
+    )
+    try:
+        return env.get_template("README.md")
+    except OSError:
+        # Cache directory became unwritable; compile in memory instead
+        return Template(_README_TEMPLATE)
+
+
+def _bytecode_cache() -> FileSystemBytecodeCache | None:
+    try:
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        # Jinja refuses temp directories it cannot make private to this user
+        return None
+
+
+_README_TEMPLATE = """# {{ project_name }}
 
 {{ description }}
 
@@ -983,131 +1290,3 @@ This project is licensed under the MIT License - see the [LICENSE](LICENSE) file
 
 *This README was automatically generated by [DocGenie](https://github.com/docgenie/docgenie) on {{ generated_date }}*
 """
-
-        return Template(template_content)
-
-    def _get_website_info(self, analysis_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract website-specific information."""
-        files = analysis_data.get("project_structure", {}).get("root", {}).get("files", [])
-        structure = analysis_data.get("project_structure", {})
-        dependencies = analysis_data.get("dependencies", {})
-
-        # Detect entry points
-        entry_points = []
-        website_files = ["index.html", "index.htm", "home.html", "main.html", "default.html"]
-        for entry in website_files:
-            if entry in files:
-                entry_points.append(entry)
-
-        # Detect build system
-        build_system = None
-        if "webpack.config.js" in files:
-            build_system = "Webpack"
-        elif "vite.config.js" in files or "vite.config.ts" in files:
-            build_system = "Vite"
-        elif "rollup.config.js" in files:
-            build_system = "Rollup"
-        elif "parcel.json" in files or any(
-            "parcel" in str(deps).lower() for deps in dependencies.values()
-        ):
-            build_system = "Parcel"
-        elif "gatsby-config.js" in files:
-            build_system = "Gatsby"
-        elif "next.config.js" in files:
-            build_system = "Next.js"
-
-        # Detect static site generator
-        ssg = None
-        if "_config.yml" in files:
-            ssg = "Jekyll"
-        elif "hugo.toml" in files or "hugo.yaml" in files:
-            ssg = "Hugo"
-        elif "mkdocs.yml" in files:
-            ssg = "MkDocs"
-        elif "docusaurus.config.js" in files:
-            ssg = "Docusaurus"
-
-        # Find asset directories
-        asset_dirs = []
-        common_asset_dirs = [
-            "public",
-            "static",
-            "assets",
-            "dist",
-            "build",
-            "css",
-            "js",
-            "images",
-            "img",
-            "fonts",
-        ]
-        for path in structure:
-            for asset_dir in common_asset_dirs:
-                if asset_dir in path.lower():
-                    asset_dirs.append(path)
-                    break
-
-        # Detect hosting/deployment info
-        deployment = []
-        if ".github/workflows" in structure or any("github" in path for path in structure):
-            deployment.append("GitHub Actions")
-        if "netlify.toml" in files or "_redirects" in files:
-            deployment.append("Netlify")
-        if "vercel.json" in files:
-            deployment.append("Vercel")
-        if "firebase.json" in files:
-            deployment.append("Firebase")
-        if "Dockerfile" in files:
-            deployment.append("Docker")
-
-        return {
-            "entry_points": entry_points,
-            "build_system": build_system,
-            "static_site_generator": ssg,
-            "asset_directories": asset_dirs[:5],  # Limit to 5
-            "deployment_platforms": deployment,
-            "has_responsive_design": self._check_responsive_design(analysis_data),
-            "framework_detected": self._detect_frontend_framework(dependencies),
-        }
-
-    def _check_responsive_design(self, analysis_data: Dict[str, Any]) -> bool:
-        """Check if website uses responsive design patterns."""
-        # This is a simple heuristic - in practice you'd analyze CSS files
-        dependencies = analysis_data.get("dependencies", {})
-
-        responsive_indicators = [
-            "bootstrap",
-            "tailwind",
-            "bulma",
-            "foundation",
-            "semantic-ui",
-            "material-ui",
-            "chakra-ui",
-            "ant-design",
-        ]
-
-        return any(
-            indicator in str(deps).lower()
-            for deps in dependencies.values()
-            for indicator in responsive_indicators
-        )
-
-    def _detect_frontend_framework(self, dependencies: Dict[str, Any]) -> str | None:
-        """Detect the primary frontend framework."""
-        frameworks = {
-            "react": "React",
-            "vue": "Vue.js",
-            "angular": "Angular",
-            "svelte": "Svelte",
-            "ember": "Ember.js",
-            "backbone": "Backbone.js",
-            "jquery": "jQuery",
-        }
-
-        for deps in dependencies.values():
-            deps_str = str(deps).lower()
-            for framework_key, framework_name in frameworks.items():
-                if framework_key in deps_str:
-                    return framework_name
-
-        return None
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import hashlib
+import html
 import json
+import os
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import cache, cached_property
 from pathlib import Path
-from typing import Any
-
-import markdown
+from typing import TYPE_CHECKING, Any
 
 from .generator import ReadmeGenerator
 from .sanitize import sanitize_html
@@ -22,11 +26,151 @@ except ModuleNotFoundError:  # pragma: no cover - optional in trimmed installs
         return text
 
 
+# The Markdown engines and Pygments are imported on first render, so commands that
+# never produce HTML do not pay for loading them
+if TYPE_CHECKING:
+    import markdown
+    from markdown_it import MarkdownIt
+    from markdown_it.renderer import RendererHTML
+    from markdown_it.token import Token
+    from markdown_it.utils import EnvType, OptionsDict
+
+# Converted documents kept per generator; oldest entries are evicted first
+_RENDER_CACHE_SIZE = 64
+
+# Below this many documents, starting worker processes costs more than rendering serially
+_POOL_MIN_DOCUMENTS = 4
+
+# "markdown" is python-markdown; "markdown-it" is the faster markdown-it-py parser
+_MARKDOWN_BACKENDS = ("markdown", "markdown-it")
+_MARKDOWN_BACKEND_ENV = "DOCGENIE_MD_BACKEND"
+
+
+def resolve_markdown_backend(markdown_backend: str | None = None) -> str:
+    """Return the Markdown backend to use, falling back to ``DOCGENIE_MD_BACKEND``.
+
+    Raises:
+        ValueError: If the backend is not one of the supported names
+    """
+    backend = markdown_backend or os.environ.get(_MARKDOWN_BACKEND_ENV) or "markdown"
+    if backend not in _MARKDOWN_BACKENDS:
+        raise ValueError(
+            f"Unknown markdown backend {backend!r}; expected one of {_MARKDOWN_BACKENDS}"
+        )
+    return backend
+
+
+def _render_code_block(
+    renderer: RendererHTML,
+    tokens: Sequence[Token],
+    idx: int,
+    options: OptionsDict,
+    env: EnvType,
+) -> str:
+    from pygments import highlight
+    from pygments.lexers import TextLexer, get_lexer_by_name
+    from pygments.util import ClassNotFound
+
+    token = tokens[idx]
+    info = token.info.split(maxsplit=1)
+    try:
+        lexer = get_lexer_by_name(info[0]) if info else TextLexer()
+    except ClassNotFound:
+        lexer = TextLexer()
+    return str(highlight(token.content, lexer, _code_formatter()))
+
+
+@cache
+def _code_formatter() -> Any:
+    from pygments.formatters import HtmlFormatter
+
+    # Same markup codehilite emits, so highlighted blocks look alike on either backend
+    return HtmlFormatter(cssclass="highlight", wrapcode=True)
+
+
+@cache
+def _markdown_it() -> MarkdownIt:
+    from markdown_it import MarkdownIt
+
+    md = MarkdownIt("commonmark").enable("table")
+    md.add_render_rule("fence", _render_code_block)
+    md.add_render_rule("code_block", _render_code_block)
+    return md
+
+
+def _render_markdown_it(source: str) -> tuple[str, str]:
+    """Render with markdown-it-py, adding the heading ids, permalinks and toc of ``toc``."""
+    from markdown.extensions.toc import slugify, unique
+    from markdown_it.token import Token
+
+    if not source.strip():
+        # python-markdown renders blank input to nothing, toc included
+        return "", ""
+    md = _markdown_it()
+    tokens = md.parse(source)
+    used_ids: set[str] = set()
+    headings: list[tuple[int, str, str]] = []
+    for token, inline in zip(tokens, tokens[1:], strict=False):
+        if token.type != "heading_open":
+            continue
+        children = inline.children or []
+        name = "".join(c.content for c in children if c.type in ("text", "code_inline")).strip()
+        anchor = unique(slugify(name, "-"), used_ids)
+        token.attrSet("id", anchor)
+        permalink = Token("html_inline", "", 0)
+        permalink.content = (
+            f'<a class="headerlink" href="#{anchor}" title="Permanent link">&para;</a>'
+        )
+        children.append(permalink)
+        headings.append((int(token.tag[1]), anchor, html.escape(name, quote=False)))
+    content = md.renderer.render(tokens, md.options, {})
+    return content, _toc_html(headings)
+
+
+def _toc_html(headings: list[tuple[int, str, str]]) -> str:
+    """Nest ``(level, anchor, name)`` headings the way python-markdown's toc does."""
+    parts: list[str] = []
+    open_levels: list[int] = []
+
+    def close_to(level: int) -> None:
+        while open_levels and open_levels[-1] >= level:
+            open_levels.pop()
+            parts.append("</li>\n")
+            if open_levels and open_levels[-1] >= level:
+                parts.append("</ul>\n")
+
+    for level, anchor, name in headings:
+        if open_levels and level > open_levels[-1]:
+            parts.append("<ul>\n")
+        else:
+            close_to(level)
+        parts.append(f'<li><a href="#{anchor}">{name}</a>')
+        open_levels.append(level)
+    close_to(0)
+    items = "\n" + "".join(parts) if parts else ""
+    return f'<div class="toc">\n<ul>{items}</ul>\n</div>\n'
+
+
 class HTMLGenerator:
-    """Generate minimal, professional HTML docs from README or analysis data."""
+    """Generate minimal, professional HTML docs from README or analysis data.
 
-    def __init__(self) -> None:
-        self.markdown_processor = markdown.Markdown(
+    ``markdown_backend`` picks the Markdown parser ("markdown" or "markdown-it"); it
+    defaults to the ``DOCGENIE_MD_BACKEND`` environment variable, then "markdown".
+    Each generator owns its Markdown processor, so one generator per thread is safe.
+    """
+
+    def __init__(self, markdown_backend: str | None = None) -> None:
+        self.markdown_backend = resolve_markdown_backend(markdown_backend)
+        # (body, toc) per converted Markdown source, keyed by content digest
+        self._render_cache: dict[str, tuple[str, str]] = {}
+
+    @cached_property
+    def markdown_processor(self) -> markdown.Markdown:
+        # Loading the extensions is the costly part of a Markdown instance, so it is built
+        # on first use and reset per document instead of rebuilt
+        import markdown
+
+        return markdown.Markdown(
             extensions=["codehilite", "toc", "tables", "fenced_code", "attr_list"],
             extension_configs={
                 "codehilite": {"css_class": "highlight", "linenums": False},
@@ -34,6 +178,23 @@ class HTMLGenerator:
             },
         )
 
+    def _convert_markdown(self, source: str) -> tuple[str, str]:
+        key = hashlib.blake2b(source.encode("utf-8"), digest_size=16).hexdigest()
+        cached = self._render_cache.get(key)
+        if cached is not None:
+            return cached
+        if self.markdown_backend == "markdown-it":
+            rendered = _render_markdown_it(source)
+        else:
+            # Markdown keeps per-document state (toc, stashed HTML) until reset
+            self.markdown_processor.reset()
+            content = self.markdown_processor.convert(source)
+            rendered = (content, getattr(self.markdown_processor, "toc", ""))
+        if len(self._render_cache) >= _RENDER_CACHE_SIZE:
+            self._render_cache.pop(next(iter(self._render_cache)))
+        self._render_cache[key] = rendered
+        return rendered
+
     def generate_from_readme(  # noqa: PLR0913
         self,
         readme_content: str,
@@ -44,13 +205,37 @@ class HTMLGenerator:
         graph_data: dict[str, Any] | None = None,
     ) -> str:
         safe_readme = redact_text(readme_content, redaction_mode, redact_patterns or [])
-        content = self.markdown_processor.convert(safe_readme)
-        full_html = self._create_html_document(content, project_name, graph_data=graph_data)
+        content, toc_html = self._convert_markdown(safe_readme)
+        full_html = self._create_html_document(
+            content, project_name, graph_data=graph_data, toc_html=toc_html
+        )
         if output_path:
             with open(output_path, "w", encoding="utf-8") as f:
                 f.write(full_html)
         return full_html
 
+    def generate_many(
+        self,
+        items: Iterable[tuple[str, str | None, str]],
+        max_workers: int | None = None,
+    ) -> list[str]:
+        """Render many ``(readme_content, output_path, project_name)`` items in parallel.
+
+        Documents are rendered across a process pool with one generator per worker
+        and returned in input order; each is written to its path when one is given.
+        """
+        tasks = list(items)
+        if len(tasks) < _POOL_MIN_DOCUMENTS:
+            return [self.generate_from_readme(*task) for task in tasks]
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(tasks) // (4 * workers))
+        with ProcessPoolExecutor(
+            max_workers=min(len(tasks), workers),
+            initializer=_init_render_worker,
+            initargs=(self.markdown_backend,),
+        ) as executor:
+            return list(executor.map(_render_document_task, tasks, chunksize=chunksize))
+
     def generate_from_analysis(
         self, analysis_data: dict[str, Any], output_path: str | None = None
     ) -> str:
@@ -80,9 +265,11 @@ class HTMLGenerator:
         project_name: str,
         *,
         graph_data: dict[str, Any] | None = None,
+        toc_html: str | None = None,
     ) -> str:
         safe_project_name = sanitize_html(project_name)
-        toc_html = getattr(self.markdown_processor, "toc", "")
+        if toc_html is None:
+            toc_html = getattr(self.markdown_processor, "toc", "")
         generated_on = datetime.now().strftime("%B %d, %Y")
         impact_block = self._impact_graph_block(graph_data)
 
@@ -95,7 +282,7 @@ class HTMLGenerator:
   <link rel=\"preconnect\" href=\"https://fonts.googleapis.com\">
   <link rel=\"preconnect\" href=\"https://fonts.gstatic.com\" crossorigin>
   <link href=\"https://fonts.googleapis.com/css2?family=IBM+Plex+Sans:wght@400;500;600;700&family=IBM+Plex+Mono:wght@400;500&display=swap\" rel=\"stylesheet\">
-  <style>{self._get_css_styles()}</style>
+  <style>{_CSS_STYLES}</style>
 </head>
 <body>
   <a class=\"skip-link\" href=\"#main-content\">Skip to main content</a>
@@ -117,12 +304,98 @@ class HTMLGenerator:
       <a href=\"#main-content\" class=\"back-to-top\" aria-label=\"Back to top\">Back to top</a>
     </main>
   </div>
-  <script>{self._get_javascript()}</script>
+  <script>{_JAVASCRIPT}</script>
 </body>
 </html>"""
 
     def _get_css_styles(self) -> str:
-        return """
+        return _CSS_STYLES
+
+    def _get_javascript(self) -> str:
+        return _JAVASCRIPT
+
+    def _impact_graph_block(self, graph_data: dict[str, Any] | None) -> str:
+        payload = json.dumps(graph_data or {"nodes": [], "edges": []}, sort_keys=True)
+        return (
+            '<section class="impact-graph-card">'
+            '<div class="impact-graph-header"><h2>Impact Graph</h2></div>'
+            '<p class="impact-graph-hint">Dependency and output-flow impact for changed files.</p>'
+            '<svg id="impact-graph" aria-label="Impact graph"></svg>'
+            '<div class="impact-graph-legend">'
+            "Blue: files, Teal: modules, Amber: output targets"
+            "</div>"
+            f'<script id="impact-graph-data" type="application/json">{payload}</script>'
+            "</section>"
+        )
+
+    def _build_impact_graph_data(self, analysis_data: dict[str, Any]) -> dict[str, Any]:
+        nodes: dict[str, dict[str, str]] = {}
+        edges: list[dict[str, str]] = []
+
+        def add_node(node_id: str, label: str, node_type: str) -> None:
+            if node_id not in nodes:
+                nodes[node_id] = {"id": node_id, "label": label, "type": node_type}
+
+        file_imports = analysis_data.get("file_imports", {})
+        if isinstance(file_imports, dict):
+            for path, imports in file_imports.items():
+                file_id = f"file:{path}"
+                add_node(file_id, str(path), "file")
+                if isinstance(imports, list):
+                    for imported in imports[:8]:
+                        module_id = f"module:{imported}"
+                        add_node(module_id, str(imported), "module")
+                        edges.append({"source": file_id, "target": module_id, "kind": "import"})
+
+        for link in analysis_data.get("output_links", [])[:60]:
+            source = str(link.get("source_file", ""))
+            target = str(link.get("target_file") or "unresolved-output")
+            if not source:
+                continue
+            src_id = f"file:{source}"
+            tgt_id = f"output:{target}"
+            add_node(src_id, source, "file")
+            add_node(tgt_id, target, "output")
+            edges.append({"source": src_id, "target": tgt_id, "kind": "output"})
+
+        diff_summary = analysis_data.get("diff_summary", {})
+        if isinstance(diff_summary, dict):
+            for item in diff_summary.get("files", [])[:40]:
+                path = str(item.get("path", ""))
+                if path:
+                    add_node(f"file:{path}", path, "file")
+
+        return {"nodes": list(nodes.values())[:120], "edges": edges[:220]}
+
+    def _extract_project_name(self, analysis_data: dict[str, Any]) -> str:
+        project_name = analysis_data.get("project_name")
+        if isinstance(project_name, str) and project_name.strip():
+            return project_name
+        git_info = analysis_data.get("git_info", {})
+        repo_name = git_info.get("repo_name") if isinstance(git_info, dict) else None
+        if isinstance(repo_name, str) and repo_name.strip():
+            return repo_name
+        root_path = analysis_data.get("root_path")
+        if isinstance(root_path, str) and root_path.strip():
+            return Path(root_path).name
+        return "Project Documentation"
+
+
+_WORKER_STATE: dict[str, HTMLGenerator] = {}
+
+
+def _init_render_worker(markdown_backend: str) -> None:
+    _WORKER_STATE["generator"] = HTMLGenerator(markdown_backend)
+
+
+def _render_document_task(payload: tuple[str, str | None, str]) -> str:
+    """Worker for `HTMLGenerator.generate_many`."""
+    generator = _WORKER_STATE.get("generator") or HTMLGenerator()
+    return generator.generate_from_readme(*payload)
+
+
+# Page assets are identical for every document, so they are built once at import
+_CSS_STYLES = """
 :root {
   --primary-color: #1f4f78;
   --accent-color: #0f766e;
@@ -253,8 +526,7 @@ body {
 }
 """
 
-    def _get_javascript(self) -> str:
-        return """
+_JAVASCRIPT = """
 // Smooth scrolling for hash links.
 document.querySelectorAll('a[href^="#"]').forEach((anchor) => {
   anchor.addEventListener('click', (e) => {
@@ -339,69 +611,3 @@ function renderImpactGraph(svg, payload) {
   svg.innerHTML = edgeSvg + nodeSvg;
 }
 """
-
-    def _impact_graph_block(self, graph_data: dict[str, Any] | None) -> str:
-        payload = json.dumps(graph_data or {"nodes": [], "edges": []}, sort_keys=True)
-        return (
-            '<section class="impact-graph-card">'
-            '<div class="impact-graph-header"><h2>Impact Graph</h2></div>'
-            '<p class="impact-graph-hint">Dependency and output-flow impact for changed files.</p>'
-            '<svg id="impact-graph" aria-label="Impact graph"></svg>'
-            '<div class="impact-graph-legend">'
-            "Blue: files, Teal: modules, Amber: output targets"
-            "</div>"
-            f'<script id="impact-graph-data" type="application/json">{payload}</script>'
-            "</section>"
-        )
-
-    def _build_impact_graph_data(self, analysis_data: dict[str, Any]) -> dict[str, Any]:
-        nodes: dict[str, dict[str, str]] = {}
-        edges: list[dict[str, str]] = []
-
-        def add_node(node_id: str, label: str, node_type: str) -> None:
-            if node_id not in nodes:
-                nodes[node_id] = {"id": node_id, "label": label, "type": node_type}
-
-        file_imports = analysis_data.get("file_imports", {})
-        if isinstance(file_imports, dict):
-            for path, imports in file_imports.items():
-                file_id = f"file:{path}"
-                add_node(file_id, str(path), "file")
-                if isinstance(imports, list):
-                    for imported in imports[:8]:
-                        module_id = f"module:{imported}"
-                        add_node(module_id, str(imported), "module")
-                        edges.append({"source": file_id, "target": module_id, "kind": "import"})
-
-        for link in analysis_data.get("output_links", [])[:60]:
-            source = str(link.get("source_file", ""))
-            target = str(link.get("target_file") or "unresolved-output")
-            if not source:
-                continue
-            src_id = f"file:{source}"
-            tgt_id = f"output:{target}"
-            add_node(src_id, source, "file")
-            add_node(tgt_id, target, "output")
-            edges.append({"source": src_id, "target": tgt_id, "kind": "output"})
-
-        diff_summary = analysis_data.get("diff_summary", {})
-        if isinstance(diff_summary, dict):
-            for item in diff_summary.get("files", [])[:40]:
-                path = str(item.get("path", ""))
-                if path:
-                    add_node(f"file:{path}", path, "file")
-
-        return {"nodes": list(nodes.values())[:120], "edges": edges[:220]}
-
-    def _extract_project_name(self, analysis_data: dict[str, Any]) -> str:
-        project_name = analysis_data.get("project_name")
-        if isinstance(project_name, str) and project_name.strip():
-            return project_name
-        git_info = analysis_data.get("git_info", {})
-        repo_name = git_info.get("repo_name") if isinstance(git_info, dict) else None
-        if isinstance(repo_name, str) and repo_name.strip():
-            return repo_name
-        root_path = analysis_data.get("root_path")
-        if isinstance(root_path, str) and root_path.strip():
-            return Path(root_path).name
-        return "Project Documentation"
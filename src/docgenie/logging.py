@@ -5,12 +5,13 @@ from __future__ import annotations
 import logging
 import sys
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import structlog
-from rich.console import Console
-from rich.logging import RichHandler
-from structlog.types import Processor
+# structlog and rich take ~100 ms to import; they are loaded on first use so commands
+# and library calls that never log skip that cost
+if TYPE_CHECKING:
+    import structlog
+    from structlog.types import Processor
 
 
 def configure_logging(verbose: bool = False, json_output: bool = False) -> None:
@@ -21,6 +22,8 @@ def configure_logging(verbose: bool = False, json_output: bool = False) -> None:
         verbose: Enable DEBUG level logging
         json_output: Output logs as JSON instead of console format
     """
+    import structlog
+
     log_level = logging.DEBUG if verbose else logging.INFO
 
     processors: list[Processor]
@@ -41,6 +44,9 @@ def configure_logging(verbose: bool = False, json_output: bool = False) -> None:
         )
     else:
         # Rich console output for humans
+        from rich.console import Console
+        from rich.logging import RichHandler
+
         console = Console(stderr=True)
         processors = [
             structlog.contextvars.merge_contextvars,
@@ -73,6 +79,8 @@ def get_logger(name: str) -> structlog.BoundLogger:
     Returns:
         Configured structured logger
     """
+    import structlog
+
     return structlog.get_logger(name)
 
 
@@ -84,11 +92,15 @@ class LogContext:
         self.token: Any | None = None
 
     def __enter__(self) -> LogContext:
+        import structlog
+
         for key, value in self.context.items():
             structlog.contextvars.bind_contextvars(**{key: value})
         return self
 
     def __exit__(self, *args: Any) -> None:
+        import structlog
+
         for key in self.context:
             structlog.contextvars.unbind_contextvars(key)
 
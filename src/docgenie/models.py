@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FunctionDoc:
     name: str
     file: Path
@@ -19,7 +20,7 @@ class FunctionDoc:
     def to_public_dict(self) -> dict[str, object]:
         return {
             "name": self.name,
-            "file": str(self.file),
+            "file": sys.intern(str(self.file)),
             "line": self.line,
             "docstring": self.docstring,
             "args": list(self.args),
@@ -28,12 +29,12 @@ class FunctionDoc:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MethodDoc(FunctionDoc):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClassDoc:
     name: str
     file: Path
@@ -46,7 +47,7 @@ class ClassDoc:
     def to_public_dict(self) -> dict[str, object]:
         return {
             "name": self.name,
-            "file": str(self.file),
+            "file": sys.intern(str(self.file)),
             "line": self.line,
             "docstring": self.docstring,
             "bases": list(self.bases),
@@ -55,7 +56,7 @@ class ClassDoc:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParseResult:
     functions: list[FunctionDoc] = field(default_factory=list)
     classes: list[ClassDoc] = field(default_factory=list)
@@ -69,14 +70,14 @@ class ParseResult:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileAnalysis:
     path: Path
     language: str
     parse: ParseResult
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileIndexRecord:
     path: str
     size: int
@@ -88,7 +89,7 @@ class FileIndexRecord:
     ignored_reason: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SymbolRecord:
     symbol_type: str
     qualified_name: str
@@ -97,7 +98,7 @@ class SymbolRecord:
     signature_hash: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PackageRecord:
     path: str
     package_type: str
@@ -105,7 +106,7 @@ class PackageRecord:
     parent_path: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunMetrics:
     scanned_files: int = 0
     changed_files: int = 0
@@ -115,7 +116,7 @@ class RunMetrics:
     skip_reasons: dict[str, int] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DocArtifactRecord:
     artifact_path: str
     target: str
@@ -123,13 +124,13 @@ class DocArtifactRecord:
     section_hashes: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SkipReason:
     path: str
     reason: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     project_name: str
     files_analyzed: int
@@ -159,7 +160,7 @@ class AnalysisResult:
             "files_analyzed": self.files_analyzed,
             "languages": dict(self.languages),
             "main_language": (
-                max(self.languages.items(), key=lambda kv: kv[1])[0] if self.languages else "N/A"
+                max(self.languages, key=self.languages.__getitem__) if self.languages else "N/A"
             ),
             "dependencies": self.dependencies,
             "project_structure": self.project_structure,
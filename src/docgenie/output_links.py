@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import os
 import re
 from pathlib import Path
 from typing import Any
 
-from .utils import get_file_language, should_ignore_file
+from .utils import compile_ignore_patterns, get_file_language, should_ignore_dir
 
 PY_WRITE_RE = re.compile(r"open\((['\"])([^'\"]+)\1\s*,\s*(['\"])[wax][bt+]?\3")
 PY_PATH_WRITE_RE = re.compile(r"Path\((['\"])([^'\"]+)\1\)\.(write_text|write_bytes)\(")
@@ -40,73 +41,76 @@ def scan_output_links(  # noqa: PLR0912, PLR0915
     selected_languages = set(languages or ["python", "javascript", "typescript", "shell"])
     links: list[dict[str, Any]] = []
     ignore = ignore_patterns or []
+    is_ignored = compile_ignore_patterns(ignore)
 
-    for path in root_path.rglob("*"):
-        if not path.is_file():
-            continue
-        rel = path.relative_to(root_path).as_posix()
-        if should_ignore_file(rel, ignore):
-            continue
-        language = get_file_language(path)
-        if language not in selected_languages:
-            continue
-        try:
-            lines = path.read_text(encoding="utf-8").splitlines()
-        except (OSError, UnicodeDecodeError):
-            continue
+    for dirpath, dirnames, filenames in os.walk(root_path):
+        # Prune ignored directories instead of enumerating and rejecting their files
+        dirnames[:] = [d for d in dirnames if not should_ignore_dir(d, ignore)]
+        for filename in filenames:
+            path = Path(dirpath, filename)
+            rel = path.relative_to(root_path).as_posix()
+            if is_ignored(rel):
+                continue
+            language = get_file_language(path)
+            if language not in selected_languages:
+                continue
+            try:
+                lines = path.read_text(encoding="utf-8").splitlines()
+            except (OSError, UnicodeDecodeError):
+                continue
 
-        for idx, line in enumerate(lines, 1):
-            raw_target: str | None = None
-            op = ""
-            confidence = "medium"
+            for idx, line in enumerate(lines, 1):
+                raw_target: str | None = None
+                op = ""
+                confidence = "medium"
 
-            if language == "python":
-                pairs = ((PY_WRITE_RE, "open-write"), (PY_PATH_WRITE_RE, "path-write"))
-                for regex, op_name in pairs:
-                    m = regex.search(line)
+                if language == "python":
+                    pairs = ((PY_WRITE_RE, "open-write"), (PY_PATH_WRITE_RE, "path-write"))
+                    for regex, op_name in pairs:
+                        m = regex.search(line)
+                        if m:
+                            raw_target = m.group(2)
+                            op = op_name
+                            confidence = "high"
+                            break
+                    if not raw_target:
+                        dynamic = PY_OPEN_GENERIC_RE.search(line)
+                        if dynamic:
+                            raw_target = "${dynamic}"
+                            op = "open-write"
+                            confidence = "low"
+                elif language in {"javascript", "typescript"}:
+                    m = JS_WRITE_RE.search(line) or JS_STREAM_RE.search(line)
                     if m:
                         raw_target = m.group(2)
-                        op = op_name
+                        op = "fs-write"
                         confidence = "high"
-                        break
-                if not raw_target:
-                    dynamic = PY_OPEN_GENERIC_RE.search(line)
-                    if dynamic:
-                        raw_target = "${dynamic}"
-                        op = "open-write"
-                        confidence = "low"
-            elif language in {"javascript", "typescript"}:
-                m = JS_WRITE_RE.search(line) or JS_STREAM_RE.search(line)
-                if m:
-                    raw_target = m.group(2)
-                    op = "fs-write"
-                    confidence = "high"
-            elif language == "shell":
-                m = SHELL_TEE_RE.search(line)
-                if m:
-                    raw_target = m.group(1)
-                    op = "tee"
-                    confidence = "medium"
-                else:
-                    m2 = SHELL_REDIRECT_RE.search(line)
-                    if m2:
-                        raw_target = m2.group(1) or m2.group(2)
-                        op = "redirect"
+                elif language == "shell":
+                    m = SHELL_TEE_RE.search(line)
+                    if m:
+                        raw_target = m.group(1)
+                        op = "tee"
                         confidence = "medium"
+                    else:
+                        m2 = SHELL_REDIRECT_RE.search(line)
+                        if m2:
+                            raw_target = m2.group(1) or m2.group(2)
+                            op = "redirect"
+                            confidence = "medium"
 
-            if not raw_target:
-                continue
-            target_file, resolved = _normalize_target(root_path, path, raw_target)
-            links.append(
-                {
-                    "source_file": rel,
-                    "source_line": idx,
-                    "target_file": target_file,
-                    "operation": op,
-                    "confidence": confidence,
-                    "resolved": resolved,
-                    "evidence_snippet": line.strip()[:160],
-                }
-            )
+                if not raw_target:
+                    continue
+                target_file, resolved = _normalize_target(root_path, path, raw_target)
+                links.append(
+                    {
+                        "source_file": rel,
+                        "source_line": idx,
+                        "target_file": target_file,
+                        "operation": op,
+                        "confidence": confidence,
+                        "resolved": resolved,
+                        "evidence_snippet": line.strip()[:160],
+                    }
+                )
 
     return links
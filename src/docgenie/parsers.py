@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import ast
+import os
 import re
-from collections.abc import Iterable, Sequence
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import cache
 from importlib import metadata
 from pathlib import Path
 from typing import Any, cast
@@ -13,6 +17,7 @@ from typing import Any, cast
 from tree_sitter_language_pack import get_parser as ts_get_parser
 
 from .models import ClassDoc, FunctionDoc, MethodDoc, ParseResult
+from .utils import get_file_language
 
 
 @dataclass
@@ -32,6 +37,12 @@ class ParserPlugin:
         raise NotImplementedError
 
 
+# Most nodes yielded by ast.walk are expressions; one set lookup rejects them.
+_PY_SYMBOL_NODES: frozenset[type[ast.AST]] = frozenset(
+    {ast.FunctionDef, ast.ClassDef, ast.Import, ast.ImportFrom}
+)
+
+
 class PythonAstParser(ParserPlugin):
     def __init__(self) -> None:
         super().__init__(name="python-ast", languages={"python"}, priority=0)
@@ -47,6 +58,8 @@ class PythonAstParser(ParserPlugin):
         imports: set[str] = set()
 
         for node in ast.walk(tree):
+            if type(node) not in _PY_SYMBOL_NODES:
+                continue
             if isinstance(node, ast.FunctionDef):
                 functions.append(
                     FunctionDoc(
@@ -85,13 +98,12 @@ class PythonAstParser(ParserPlugin):
                         methods=methods,
                     )
                 )
-            elif isinstance(node, ast.Import | ast.ImportFrom):
-                if isinstance(node, ast.Import):
-                    imports.update(alias.name for alias in node.names)
-                else:
-                    module = node.module or ""
-                    for alias in node.names:
-                        imports.add(f"{module}.{alias.name}" if module else alias.name)
+            elif isinstance(node, ast.Import):
+                imports.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                module = node.module or ""
+                for alias in node.names:
+                    imports.add(f"{module}.{alias.name}" if module else alias.name)
 
         return ParseResult(functions=functions, classes=classes, imports=imports)
 
@@ -107,45 +119,74 @@ class RegexParser(ParserPlugin):
         )
 
     def parse(self, content: str, path: Path, language: str) -> ParseResult:
-        lines = content.splitlines()
+        patterns = _language_patterns(language)
+        if not (patterns.functions or patterns.classes or patterns.imports):
+            return ParseResult()
+
+        # Specialize the loop to this language: bind its tables once and drop
+        # groups it has no patterns for.
+        function_patterns = patterns.functions
+        function_markers = patterns.function_markers
+        class_patterns = patterns.classes
+        class_markers = patterns.class_markers
+        import_patterns = patterns.imports
+        import_markers = patterns.import_markers
+
+        # Only lines that survive the prescan are ever materialized as strings.
+        starts = _line_starts(content)
+        last_index = len(starts) - 1
         functions: list[FunctionDoc] = []
         classes: list[ClassDoc] = []
         imports: set[str] = set()
-
-        patterns = _language_patterns(language)
-        for idx, raw_line in enumerate(lines, 1):
-            line = raw_line.strip()
-            for pattern in patterns.functions:
-                match = re.search(pattern, line)
-                if match:
-                    functions.append(
-                        FunctionDoc(
-                            name=match.group(1),
-                            file=path,
-                            line=idx,
-                            docstring=None,
-                            args=[],
+        add_function = functions.append
+        add_class = classes.append
+        add_import = imports.add
+
+        candidates: Iterable[int] = (
+            range(len(starts))
+            if patterns.prescan is None
+            else _candidate_lines(content, starts, patterns.prescan)
+        )
+        for line_index in candidates:
+            end = starts[line_index + 1] - 1 if line_index < last_index else len(content)
+            line = content[starts[line_index] : end].strip()
+            if not line:
+                continue
+            idx = line_index + 1
+            if function_patterns and _has_marker(line, function_markers):
+                for pattern in function_patterns:
+                    match = pattern.search(line)
+                    if match:
+                        add_function(
+                            FunctionDoc(
+                                name=match.group(1),
+                                file=path,
+                                line=idx,
+                                docstring=None,
+                                args=[],
+                            )
                         )
-                    )
-                    break
-
-            for pattern in patterns.classes:
-                match = re.search(pattern, line)
-                if match:
-                    classes.append(
-                        ClassDoc(
-                            name=match.group(1),
-                            file=path,
-                            line=idx,
-                            docstring=None,
+                        break
+
+            if class_patterns and _has_marker(line, class_markers):
+                for pattern in class_patterns:
+                    match = pattern.search(line)
+                    if match:
+                        add_class(
+                            ClassDoc(
+                                name=match.group(1),
+                                file=path,
+                                line=idx,
+                                docstring=None,
+                            )
                         )
-                    )
-                    break
+                        break
 
-            for pattern in patterns.imports:
-                match = re.search(pattern, line)
-                if match:
-                    imports.add(match.group(1).strip())
+            if import_patterns and _has_marker(line, import_markers):
+                for pattern in import_patterns:
+                    match = pattern.search(line)
+                    if match:
+                        add_import(match.group(1).strip())
 
         return ParseResult(functions=functions, classes=classes, imports=imports)
 
@@ -158,114 +199,207 @@ class TreeSitterParser(ParserPlugin):
     def __init__(self) -> None:
         super().__init__(name="tree-sitter", languages=self.SUPPORTED, priority=50)
         self.available = ts_get_parser is not None
+        self._parsers: dict[str, Any] = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Native parser handles cannot be pickled; workers build their own.
+        state = dict(self.__dict__)
+        state["_parsers"] = {}
+        return state
+
+    def _parser_for(self, language: str) -> Any:
+        """Return the generated tree-sitter parser for `language`, built once per instance."""
+        parser = self._parsers.get(language)
+        if parser is None:
+            parser = self._parsers[language] = ts_get_parser(language)
+        return parser
 
     def parse(self, content: str, path: Path, language: str) -> ParseResult:
-        parser = ts_get_parser(language)
-        tree = parser.parse(bytes(content, "utf-8"))
+        parser = self._parser_for(language)
+        # Node offsets are byte offsets, so slice the encoded buffer and decode only the spans.
+        source = content.encode("utf-8")
+        tree = parser.parse(source)
         root = tree.root_node
 
         functions: list[FunctionDoc] = []
         classes: list[ClassDoc] = []
         imports: set[str] = set()
 
-        def text(node: Any) -> str:
-            return content[node.start_byte : node.end_byte]
+        add_function = functions.append
+        add_class = classes.append
+        add_import = imports.add
 
+        node_kinds = _node_kinds(language)
         for node in _iter_tree_sitter_nodes(root):
-            node_type = node.type
-            if node_type in _function_nodes(language):
-                name = _extract_name(node, content)
-                if name:
-                    functions.append(
-                        FunctionDoc(
-                            name=name,
-                            file=path,
-                            line=node.start_point[0] + 1,
-                            docstring=None,
-                            args=[],
-                        )
+            kind = node_kinds.get(node.type)
+            if kind is None:
+                continue
+            if kind == "import":
+                add_import(source[node.start_byte : node.end_byte].decode("utf-8", "replace"))
+                continue
+            name = _extract_name(node, source)
+            if not name:
+                continue
+            if kind == "function":
+                add_function(
+                    FunctionDoc(
+                        name=name,
+                        file=path,
+                        line=node.start_point[0] + 1,
+                        docstring=None,
+                        args=[],
                     )
-            if node_type in _class_nodes(language):
-                name = _extract_name(node, content)
-                if name:
-                    classes.append(
-                        ClassDoc(
-                            name=name,
-                            file=path,
-                            line=node.start_point[0] + 1,
-                            docstring=None,
-                        )
+                )
+            else:
+                add_class(
+                    ClassDoc(
+                        name=name,
+                        file=path,
+                        line=node.start_point[0] + 1,
+                        docstring=None,
                     )
-            if node_type in _import_nodes(language):
-                name = text(node)
-                imports.add(name)
+                )
 
         return ParseResult(functions=functions, classes=classes, imports=imports)
 
 
 @dataclass
 class _LanguagePatterns:
-    functions: Sequence[str] = field(default_factory=tuple)
-    classes: Sequence[str] = field(default_factory=tuple)
-    imports: Sequence[str] = field(default_factory=tuple)
-
-
-def _language_patterns(language: str) -> _LanguagePatterns:
-    lang = language.lower()
-    return {
-        "javascript": _LanguagePatterns(
-            functions=(
-                r"function\s+(\w+)\s*\(",
-                r"(\w+)\s*:\s*function\s*\(",
-                r"(\w+)\s*=\s*function\s*\(",
-                r"(\w+)\s*=\s*\([^)]*\)\s*=>",
-                r"(?:const|let|var)\s+(\w+)\s*=\s*\([^)]*\)\s*=>",
-            ),
-            classes=(r"class\s+(\w+)",),
-            imports=(
-                r'import\s+.*\s+from\s+["\']([^"\']+)["\']',
-                r'import\s+["\']([^"\']+)["\']',
-                r'require\s*\(\s*["\']([^"\']+)["\']\s*\)',
-            ),
-        ),
-        "typescript": _LanguagePatterns(
-            functions=(
-                r"function\s+(\w+)\s*\(",
-                r"(\w+)\s*=\s*\([^)]*\)\s*=>",
-                r"(?:const|let|var)\s+(\w+)\s*=\s*\([^)]*\)\s*=>",
-            ),
-            classes=(r"class\s+(\w+)",),
-            imports=(
-                r'import\s+.*\s+from\s+["\']([^"\']+)["\']',
-                r'import\s+["\']([^"\']+)["\']',
-            ),
-        ),
-        "java": _LanguagePatterns(
-            functions=(r"(?:public|private|protected)?\s*(?:static)?\s*\w+\s+(\w+)\s*\(",),
-            classes=(r"(?:public|private)?\s*class\s+(\w+)",),
-            imports=(r"import\s+([^;]+);",),
-        ),
-        "cpp": _LanguagePatterns(
-            functions=(r"^\s*(?:\w+\s+)*(\w+)\s*\([^)]*\)\s*(?:{|;)",),
-            classes=(r"class\s+(\w+)",),
-            imports=(r"#include\s*[<\"]([^>\"]+)[>\"]",),
+    functions: Sequence[re.Pattern[str]] = field(default_factory=tuple)
+    classes: Sequence[re.Pattern[str]] = field(default_factory=tuple)
+    imports: Sequence[re.Pattern[str]] = field(default_factory=tuple)
+    # Literal keywords every pattern in the group requires; an empty tuple disables the filter.
+    function_markers: tuple[str, ...] = ()
+    class_markers: tuple[str, ...] = ()
+    import_markers: tuple[str, ...] = ()
+    # Union of every marker, used to jump straight to candidate lines in one pass.
+    prescan: re.Pattern[str] | None = field(init=False, default=None)
+
+    def __post_init__(self) -> None:
+        groups = (
+            (self.functions, self.function_markers),
+            (self.classes, self.class_markers),
+            (self.imports, self.import_markers),
+        )
+        if any(patterns and not markers for patterns, markers in groups):
+            return  # some group can match anywhere, so no line can be skipped
+        markers = {marker for patterns, group in groups if patterns for marker in group}
+        if markers:
+            ordered = sorted(markers, key=len, reverse=True)
+            self.prescan = re.compile("|".join(re.escape(marker) for marker in ordered))
+
+
+def _has_marker(line: str, markers: tuple[str, ...]) -> bool:
+    """Cheap substring prefilter so regexes only run on lines that can match."""
+    return not markers or any(marker in line for marker in markers)
+
+
+def _line_starts(content: str) -> list[int]:
+    """Offsets at which each newline-separated line of `content` begins."""
+    starts = [0]
+    find = content.find
+    pos = find("\n")
+    while pos != -1:
+        starts.append(pos + 1)
+        pos = find("\n", pos + 1)
+    return starts
+
+
+def _candidate_lines(content: str, starts: list[int], prescan: re.Pattern[str]) -> Iterator[int]:
+    """Yield indexes of lines containing a marker, scanning the buffer once."""
+    search = prescan.search
+    match = search(content)
+    while match:
+        line_index = bisect_right(starts, match.start()) - 1
+        yield line_index
+        if line_index + 1 >= len(starts):
+            return
+        match = search(content, starts[line_index + 1])
+
+
+def _compile(*patterns: str) -> tuple[re.Pattern[str], ...]:
+    return tuple(re.compile(pattern) for pattern in patterns)
+
+
+# Compiled once at import so the per-line loop never goes through the `re` cache.
+_LANGUAGE_PATTERNS: dict[str, _LanguagePatterns] = {
+    "javascript": _LanguagePatterns(
+        functions=_compile(
+            r"function\s+(\w+)\s*\(",
+            r"(\w+)\s*:\s*function\s*\(",
+            r"(\w+)\s*=\s*function\s*\(",
+            r"(\w+)\s*=\s*\([^)]*\)\s*=>",
+            r"(?:const|let|var)\s+(\w+)\s*=\s*\([^)]*\)\s*=>",
         ),
-        "c": _LanguagePatterns(
-            functions=(r"^\s*(?:\w+\s+)*(\w+)\s*\([^)]*\)\s*(?:{|;)",),
-            classes=(),
-            imports=(r"#include\s*[<\"]([^>\"]+)[>\"]",),
+        classes=_compile(r"class\s+(\w+)"),
+        imports=_compile(
+            r'import\s+.*\s+from\s+["\']([^"\']+)["\']',
+            r'import\s+["\']([^"\']+)["\']',
+            r'require\s*\(\s*["\']([^"\']+)["\']\s*\)',
         ),
-        "go": _LanguagePatterns(
-            functions=(r"func\s+(?:\([^)]*\)\s+)?(\w+)\s*\(",),
-            classes=(r"type\s+(\w+)\s+struct",),
-            imports=(r'import\s+(?:\(\s*)?["]([^"]+)["]',),
+        function_markers=("function", "=>"),
+        class_markers=("class",),
+        import_markers=("import", "require"),
+    ),
+    "typescript": _LanguagePatterns(
+        functions=_compile(
+            r"function\s+(\w+)\s*\(",
+            r"(\w+)\s*=\s*\([^)]*\)\s*=>",
+            r"(?:const|let|var)\s+(\w+)\s*=\s*\([^)]*\)\s*=>",
         ),
-        "rust": _LanguagePatterns(
-            functions=(r"fn\s+(\w+)\s*\(",),
-            classes=(r"(?:struct|enum)\s+(\w+)",),
-            imports=(r"use\s+([^;]+);",),
+        classes=_compile(r"class\s+(\w+)"),
+        imports=_compile(
+            r'import\s+.*\s+from\s+["\']([^"\']+)["\']',
+            r'import\s+["\']([^"\']+)["\']',
         ),
-    }.get(lang, _LanguagePatterns())
+        function_markers=("function", "=>"),
+        class_markers=("class",),
+        import_markers=("import",),
+    ),
+    "java": _LanguagePatterns(
+        functions=_compile(r"(?:public|private|protected)?\s*(?:static)?\s*\w+\s+(\w+)\s*\("),
+        classes=_compile(r"(?:public|private)?\s*class\s+(\w+)"),
+        imports=_compile(r"import\s+([^;]+);"),
+        function_markers=("(",),
+        class_markers=("class",),
+        import_markers=("import",),
+    ),
+    "cpp": _LanguagePatterns(
+        functions=_compile(r"^\s*(?:\w+\s+)*(\w+)\s*\([^)]*\)\s*(?:{|;)"),
+        classes=_compile(r"class\s+(\w+)"),
+        imports=_compile(r"#include\s*[<\"]([^>\"]+)[>\"]"),
+        function_markers=("(",),
+        class_markers=("class",),
+        import_markers=("#include",),
+    ),
+    "c": _LanguagePatterns(
+        functions=_compile(r"^\s*(?:\w+\s+)*(\w+)\s*\([^)]*\)\s*(?:{|;)"),
+        classes=(),
+        imports=_compile(r"#include\s*[<\"]([^>\"]+)[>\"]"),
+        function_markers=("(",),
+        import_markers=("#include",),
+    ),
+    "go": _LanguagePatterns(
+        functions=_compile(r"func\s+(?:\([^)]*\)\s+)?(\w+)\s*\("),
+        classes=_compile(r"type\s+(\w+)\s+struct"),
+        imports=_compile(r'import\s+(?:\(\s*)?["]([^"]+)["]'),
+        function_markers=("func",),
+        class_markers=("struct",),
+        import_markers=("import",),
+    ),
+    "rust": _LanguagePatterns(
+        functions=_compile(r"fn\s+(\w+)\s*\("),
+        classes=_compile(r"(?:struct|enum)\s+(\w+)"),
+        imports=_compile(r"use\s+([^;]+);"),
+        function_markers=("fn",),
+        class_markers=("struct", "enum"),
+        import_markers=("use",),
+    ),
+}
+
+
+def _language_patterns(language: str) -> _LanguagePatterns:
+    return _LANGUAGE_PATTERNS.get(language.lower(), _LanguagePatterns())
 
 
 def _function_nodes(language: str) -> set[str]:
@@ -306,6 +440,15 @@ def _import_nodes(language: str) -> set[str]:
     }.get(language, set())
 
 
+@cache
+def _node_kinds(language: str) -> dict[str, str]:
+    """Map each interesting node type to its kind so dispatch is a single lookup."""
+    kinds = dict.fromkeys(_import_nodes(language), "import")
+    kinds.update(dict.fromkeys(_class_nodes(language), "class"))
+    kinds.update(dict.fromkeys(_function_nodes(language), "function"))
+    return kinds
+
+
 def _iter_tree_sitter_nodes(root: Any) -> Iterable[Any]:
     """Depth-first traversal over a tree-sitter node tree."""
     cursor = root.walk()
@@ -332,12 +475,17 @@ def _iter_tree_sitter_nodes(root: Any) -> Iterable[Any]:
             break
 
 
-def _extract_name(node: Any, content: str) -> str | None:
-    """Best-effort extraction of identifier from a tree-sitter node."""
+def _extract_name(node: Any, source: str | bytes) -> str | None:
+    """Best-effort extraction of identifier from a tree-sitter node.
+
+    Node offsets are byte offsets, so `source` should be the encoded buffer the
+    tree was parsed from; a `str` is only correct for ASCII content.
+    """
     if hasattr(node, "child_by_field_name"):
         name_node = node.child_by_field_name("name")
         if name_node:
-            return content[name_node.start_byte : name_node.end_byte]
+            span = source[name_node.start_byte : name_node.end_byte]
+            return span.decode("utf-8", "replace") if isinstance(span, bytes) else span
     return None
 
 
@@ -389,6 +537,52 @@ class ParserRegistry:
             return ParseResult()
         return parser.parse(content, path, language)
 
+    def parse_files(
+        self, paths: Iterable[Path], max_workers: int | None = None
+    ) -> dict[Path, ParseResult]:
+        """Parse many files in parallel across a process pool.
+
+        Files with no recognized language or no supporting plugin are skipped.
+        The registry is shipped to each worker once, so custom plugins are honored.
+        """
+        tasks: list[tuple[str, str]] = []
+        for path in paths:
+            language = get_file_language(path)
+            if language and self.resolve(language):
+                tasks.append((str(path), language))
+        if not tasks:
+            return {}
+
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(tasks) // (4 * workers))
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_parse_worker, initargs=(self,)
+        ) as executor:
+            results = executor.map(_parse_file_task, tasks, chunksize=chunksize)
+            return {
+                Path(path_str): parsed
+                for (path_str, _language), parsed in zip(tasks, results, strict=True)
+            }
+
+
+_WORKER_STATE: dict[str, ParserRegistry] = {}
+
+
+def _init_parse_worker(registry: ParserRegistry) -> None:
+    _WORKER_STATE["registry"] = registry
+
+
+def _parse_file_task(payload: tuple[str, str]) -> ParseResult:
+    """Worker for `ParserRegistry.parse_files`."""
+    path_str, language = payload
+    registry = _WORKER_STATE.get("registry") or ParserRegistry()
+    path = Path(path_str)
+    try:
+        content = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return ParseResult()
+    return registry.parse(content, path, language)
+
 
 def _load_external_plugins() -> Iterable[ParserPlugin]:
     try:
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import Counter, defaultdict
+from itertools import chain
 from typing import Any
 
 _DEFAULT_WEIGHTS = {"churn": 0.35, "complexity": 0.35, "surface": 0.30}
@@ -34,15 +35,11 @@ def build_reviews(
     if weights:
         applied_weights.update(weights)
 
-    symbol_counts: dict[str, int] = defaultdict(int)
-    for func in functions:
-        file_path = str(func.get("file", "")).replace("\\", "/")
-        if file_path:
-            symbol_counts[file_path] += 1
-    for cls in classes:
-        file_path = str(cls.get("file", "")).replace("\\", "/")
-        if file_path:
-            symbol_counts[file_path] += 1
+    # Only the file column is needed here, so count it in a single pass.
+    symbol_counts = Counter(
+        str(symbol.get("file", "")).replace("\\", "/") for symbol in chain(functions, classes)
+    )
+    symbol_counts.pop("", None)
 
     file_reviews: list[dict[str, Any]] = []
     folder_rollups: dict[str, dict[str, Any]] = defaultdict(
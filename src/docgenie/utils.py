@@ -2,11 +2,16 @@
 Utility functions for DocGenie.
 """
 
+import copy
 import fnmatch
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
 from git import GitCommandError, InvalidGitRepositoryError, NoSuchPathError, Repo
 from pathspec import PathSpec
@@ -122,6 +127,72 @@ LANGUAGE_EXTENSIONS = {
     ".txt": "text",
 }
 
+# Website detection signals; file names are matched exactly, frameworks and
+# directory names as substrings
+_WEBSITE_FILES = frozenset(
+    {
+        "index.html",
+        "index.htm",
+        "home.html",
+        "main.html",
+        "default.html",
+    }
+)
+_STATIC_GENERATORS = frozenset(
+    {
+        "_config.yml",
+        "gatsby-config.js",
+        "next.config.js",
+        "nuxt.config.js",
+        "hugo.toml",
+        "hugo.yaml",
+        "_config.toml",
+        "mkdocs.yml",
+        "docusaurus.config.js",
+    }
+)
+_HUGO_JEKYLL_CONFIGS = frozenset({"_config.yml", "hugo.toml", "hugo.yaml"})
+_WEB_LANGUAGES = frozenset({"html", "css", "javascript"})
+_WEB_FRAMEWORKS = (
+    "react",
+    "vue",
+    "angular",
+    "svelte",
+    "gatsby",
+    "next",
+    "nuxt",
+    "hugo",
+    "jekyll",
+    "express",
+    "koa",
+    "fastify",
+    "django",
+    "flask",
+    "fastapi",
+    "rails",
+    "sinatra",
+    "laravel",
+    "symfony",
+)
+_WEB_DIRS = (
+    "public",
+    "static",
+    "assets",
+    "dist",
+    "build",
+    "www",
+    "html",
+    "css",
+    "js",
+    "images",
+    "img",
+)
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# NUL-separated hash, author name, author email, strict ISO commit date and message
+_COMMIT_FORMAT = "%H%x00%an%x00%ae%x00%cI%x00%B"
+
 PACKAGE_MANIFESTS = {
     "pyproject.toml": "python",
     "requirements.txt": "python",
@@ -134,6 +205,64 @@ PACKAGE_MANIFESTS = {
 }
 
 
+_GLOB_CHARS = frozenset("*?[/\\")
+
+
+@dataclass(frozen=True)
+class _IgnoreMatcher:
+    """Ignore patterns grouped by the cheapest test that can decide them."""
+
+    literals: frozenset[str]
+    suffixes: tuple[str, ...]
+    globs: re.Pattern[str] | None
+
+    def matches_name(self, name: str) -> bool:
+        return (
+            name in self.literals
+            or name.endswith(self.suffixes)
+            or (self.globs is not None and self.globs.match(name) is not None)
+        )
+
+    def matches_path(self, path: str, parts: List[str]) -> bool:
+        if not self.literals.isdisjoint(parts):
+            return True
+        if self.suffixes and any(part.endswith(self.suffixes) for part in parts):
+            return True
+        if self.globs is None:
+            return False
+        return self.globs.match(path) is not None or any(map(self.globs.match, parts))
+
+
+@lru_cache(maxsize=64)
+def _build_ignore_matcher(patterns: tuple[str, ...]) -> _IgnoreMatcher:
+    """Split patterns into plain names, ``*suffix`` globs and a regex for the rest."""
+    literals: set[str] = set()
+    suffixes: list[str] = []
+    globs: list[str] = []
+    for pattern in map(os.path.normcase, patterns):
+        if _GLOB_CHARS.isdisjoint(pattern):
+            literals.add(pattern)
+        elif pattern.startswith("*") and len(pattern) > 1 and _GLOB_CHARS.isdisjoint(pattern[1:]):
+            suffixes.append(pattern[1:])
+        else:
+            globs.append(pattern)
+    compiled = (
+        re.compile("|".join(f"(?:{fnmatch.translate(pattern)})" for pattern in globs))
+        if globs
+        else None
+    )
+    return _IgnoreMatcher(frozenset(literals), tuple(suffixes), compiled)
+
+
+def _ignore_matcher(additional_patterns: List[str] | None) -> _IgnoreMatcher:
+    if additional_patterns:
+        return _build_ignore_matcher((*DEFAULT_IGNORE_PATTERNS, *additional_patterns))
+    return _DEFAULT_IGNORE_MATCHER
+
+
+_DEFAULT_IGNORE_MATCHER = _build_ignore_matcher(tuple(DEFAULT_IGNORE_PATTERNS))
+
+
 def get_file_language(file_path: Path) -> str | None:
     """
     Determine the programming language of a file based on its extension.
@@ -159,27 +288,48 @@ def should_ignore_file(file_path: str, additional_patterns: List[str] | None = N
     Returns:
         True if the file should be ignored
     """
-    patterns = DEFAULT_IGNORE_PATTERNS.copy()
-    if additional_patterns:
-        patterns.extend(additional_patterns)
+    return _matches_ignore(_ignore_matcher(additional_patterns), file_path)
 
-    file_path = str(file_path)
 
-    # Check against all patterns
-    for pattern in patterns:
-        if fnmatch.fnmatch(file_path, pattern) or fnmatch.fnmatch(
-            os.path.basename(file_path), pattern
-        ):
-            return True
+def compile_ignore_patterns(additional_patterns: List[str] | None = None) -> Callable[[str], bool]:
+    """
+    Bind ignore patterns once for callers that check many paths.
 
-        # Check if any part of the path matches the pattern
-        normalized_path = file_path.replace("\\", "/")
-        path_parts = normalized_path.split("/")
-        for part in path_parts:
-            if fnmatch.fnmatch(part, pattern):
-                return True
+    Args:
+        additional_patterns: Additional patterns to check
 
-    return False
+    Returns:
+        Predicate equivalent to :func:`should_ignore_file` with these patterns
+    """
+    matcher = _ignore_matcher(additional_patterns)
+
+    def is_ignored(file_path: str) -> bool:
+        return _matches_ignore(matcher, file_path)
+
+    return is_ignored
+
+
+def _matches_ignore(matcher: _IgnoreMatcher, file_path: str) -> bool:
+    file_path = os.path.normcase(str(file_path))
+    path_parts = file_path.replace("\\", "/").split("/")
+    return matcher.matches_path(file_path, path_parts)
+
+
+def should_ignore_dir(dir_name: str, additional_patterns: List[str] | None = None) -> bool:
+    """
+    Check if a directory can be pruned from a walk by its name alone.
+
+    Every path below a matching directory contains its name as a segment, so
+    :func:`should_ignore_file` would reject all of them anyway.
+
+    Args:
+        dir_name: Directory basename
+        additional_patterns: Additional patterns to check
+
+    Returns:
+        True if the directory and everything below it should be skipped
+    """
+    return _ignore_matcher(additional_patterns).matches_name(os.path.normcase(dir_name))
 
 
 def load_gitignore_spec(root_path: Path) -> PathSpec | None:
@@ -232,22 +382,116 @@ def is_probably_generated_file(file_path: str, extra_patterns: List[str] | None
     return False
 
 
-def extract_git_info(repo_path: Path) -> Dict[str, Any]:
+def extract_git_info(repo_path: Path, *, include_contributors: bool = False) -> Dict[str, Any]:
     """
     Extract git repository information.
 
+    Results are cached per resolved repository path and reused while the git
+    files behind HEAD, the current branch tip and the remotes are unchanged;
+    use :func:`clear_git_info_cache` to force a fresh read.
+
     Args:
         repo_path: Path to the repository
+        include_contributors: Also count contributors with ``git shortlog``,
+            which walks the full history
 
     Returns:
         Dictionary containing git information
     """
+    resolved = Path(repo_path).resolve()
+    state = _git_state(resolved)
+    return copy.deepcopy(_read_git_info(str(resolved), include_contributors, state))
+
+
+def clear_git_info_cache() -> None:
+    """Drop cached results from :func:`extract_git_info`."""
+    _read_git_info.cache_clear()
+
+
+def _git_state(repo_path: Path) -> tuple[tuple[str, int, int, int], ...]:
+    """Stat signature of HEAD, the ref it points to, packed-refs and the config.
+
+    Git updates refs by renaming a lock file into place, so a new commit, branch
+    switch or remote change always gives one of these files a new inode or mtime.
+    """
+    git_dir = _find_git_dir(repo_path)
+    if git_dir is None:
+        return ()
+    # Linked worktrees keep their own HEAD but share refs and config with the main repo
+    try:
+        common_dir = (
+            git_dir / (git_dir / "commondir").read_text(encoding="utf-8").strip()
+        ).resolve()
+    except OSError:
+        common_dir = git_dir
+    watched = [git_dir / "HEAD", common_dir / "packed-refs", common_dir / "config"]
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        head = ""
+    if head.startswith("ref: "):
+        watched.append(common_dir / head[len("ref: ") :])
+
+    signature = []
+    for path in watched:
+        try:
+            stat = path.stat()
+        except OSError:
+            signature.append((str(path), -1, -1, -1))
+            continue
+        signature.append((str(path), stat.st_ino, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _find_git_dir(repo_path: Path) -> Path | None:
+    for candidate in (repo_path, *repo_path.parents):
+        dot_git = candidate / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            # Worktrees and submodules point at their git dir from a ".git" file
+            try:
+                content = dot_git.read_text(encoding="utf-8").strip()
+            except OSError:
+                return None
+            if not content.startswith("gitdir: "):
+                return None
+            return (candidate / content[len("gitdir: ") :]).resolve()
+    return None
+
+
+@lru_cache(maxsize=32)
+def _read_git_info(
+    repo_path: str, include_contributors: bool, state: tuple[tuple[str, int, int, int], ...]
+) -> Dict[str, Any]:
+    # ``state`` is only part of the cache key, so a changed repository is read again
     git_info: Dict[str, Any] = {}
     try:
         repo = Repo(repo_path, search_parent_directories=True)
     except (InvalidGitRepositoryError, NoSuchPathError):
         return git_info
 
+    if not include_contributors:
+        _read_head_info(repo, git_info)
+        return git_info
+
+    # shortlog walks the whole history; run it while the head reads happen
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        # Without a revision shortlog reads stdin
+        shortlog = pool.submit(repo.git.shortlog, "-sn", "HEAD")
+        _read_head_info(repo, git_info)
+
+        # Contributor count (best-effort)
+        try:
+            contributors = [line for line in shortlog.result().split("\n") if line.strip()]
+            git_info["contributor_count"] = len(contributors)
+        except GitCommandError:
+            pass
+
+    return git_info
+
+
+def _read_head_info(repo: Repo, git_info: Dict[str, Any]) -> None:
     # Remote URL / repo name
     try:
         origin = repo.remotes.origin
@@ -264,29 +508,21 @@ def extract_git_info(repo_path: Path) -> Dict[str, Any]:
     except (TypeError, GitCommandError):
         pass
 
-    # Latest commit info
+    # Latest commit info, read with one ``git log`` call instead of the two
+    # ``cat-file`` processes GitPython starts to load a commit object.
     try:
-        commit = repo.head.commit
+        raw_commit = repo.git.log("-1", f"--format={_COMMIT_FORMAT}")
+        commit_hash, author_name, author_email, committed, message = raw_commit.split("\x00", 4)
         git_info["latest_commit"] = {
-            "hash": commit.hexsha,
-            "author_name": commit.author.name,
-            "author_email": commit.author.email,
-            "date": str(commit.committed_datetime),
-            "message": commit.message.strip(),
+            "hash": commit_hash,
+            "author_name": author_name,
+            "author_email": author_email,
+            "date": str(datetime.fromisoformat(committed)),
+            "message": message.strip(),
         }
     except (ValueError, GitCommandError, AttributeError):
         pass
 
-    # Contributor count (best-effort)
-    try:
-        shortlog = repo.git.shortlog("-sn")
-        contributors = [line for line in shortlog.split("\n") if line.strip()]
-        git_info["contributor_count"] = len(contributors)
-    except GitCommandError:
-        pass
-
-    return git_info
-
 
 def extract_repo_name_from_url(url: str) -> str:
     """
@@ -298,6 +534,13 @@ def extract_repo_name_from_url(url: str) -> str:
     Returns:
         Repository name
     """
+    # Split the common shapes directly; the regexes below stay as the fallback
+    # (``$`` also matches before a trailing newline, which the split does not).
+    if not url.endswith("\n"):
+        name = _split_repo_name(url)
+        if name:
+            return name
+
     # Handle different URL formats
     if url.startswith("git@"):
         # SSH format: git@github.com:user/repo.git
@@ -312,6 +555,24 @@ def extract_repo_name_from_url(url: str) -> str:
     return url
 
 
+def _split_repo_name(url: str) -> str | None:
+    if url.startswith("git@"):
+        path = url.partition(":")[2]
+        if path.count("/") != 1:
+            return None
+        owner, repo = path.split("/")
+    else:
+        parts = url.removesuffix("/").rsplit("/", 2)
+        if len(parts) != 3:
+            return None
+        owner, repo = parts[1], parts[2]
+    if repo.endswith(".git") and len(repo) > 4:
+        repo = repo[:-4]
+    if not owner or not repo:
+        return None
+    return f"{owner}/{repo}"
+
+
 def format_file_size(size_bytes: int) -> str:
     """
     Format file size in human-readable format.
@@ -325,14 +586,36 @@ def format_file_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0 B"
 
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    size = float(size_bytes)
-    i = 0
-    while size >= 1024 and i < len(size_names) - 1:
-        size /= 1024.0
-        i += 1
+    # Each unit step is 2**10, so the bit length picks the unit without a loop
+    i = min(len(_SIZE_UNITS) - 1, max(0, (max(size_bytes, 0).bit_length() - 1) // 10))
+    return f"{size_bytes / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
 
-    return f"{size:.1f} {size_names[i]}"
+
+def dependency_text(deps: Any) -> str:
+    """
+    Join the names in one dependency group into newline-separated text.
+
+    Nested groups (such as package.json's ``dependencies``/``devDependencies``)
+    contribute their keys as well as their entries. Unlike ``str(deps)`` no
+    quotes or brackets are added, and since no keyword contains a newline, a
+    substring match never spans two names.
+
+    Args:
+        deps: A dependency group as stored in ``analysis_data["dependencies"]``
+
+    Returns:
+        Newline-joined dependency names
+    """
+    if isinstance(deps, dict):
+        return "\n".join(f"{key}\n{dependency_text(value)}" for key, value in deps.items())
+    if isinstance(deps, (list, tuple)):
+        return "\n".join(item if isinstance(item, str) else dependency_text(item) for item in deps)
+    return str(deps)
+
+
+def _dependency_blob(dependencies: Dict[str, Any]) -> str:
+    """Lower-case every dependency group once so framework checks are substring tests."""
+    return "\n".join(dependency_text(deps) for deps in dependencies.values()).lower()
 
 
 def is_website_project(analysis_data: Dict[str, Any]) -> bool:
@@ -349,143 +632,99 @@ def is_website_project(analysis_data: Dict[str, Any]) -> bool:
     dependencies = analysis_data.get("dependencies", {})
     languages = analysis_data.get("languages", {})
 
-    # Check for common website files
-    website_files = ["index.html", "index.htm", "home.html", "main.html", "default.html"]
-    has_html_entry = any(f in files for f in website_files)
+    file_names = set(files)
 
-    # Check for CSS files
-    has_css = any(f.endswith(".css") for f in files)
+    # Check for common website files
+    if not file_names.isdisjoint(_WEBSITE_FILES):
+        return True
 
     # Check for static website generators
-    static_generators = [
-        "_config.yml",
-        "gatsby-config.js",
-        "next.config.js",
-        "nuxt.config.js",
-        "hugo.toml",
-        "hugo.yaml",
-        "_config.toml",
-        "mkdocs.yml",
-        "docusaurus.config.js",
-    ]
-    has_static_generator = any(f in files for f in static_generators)
+    if not file_names.isdisjoint(_STATIC_GENERATORS):
+        return True
 
     # Check for web framework dependencies
-    web_frameworks = [
-        "react",
-        "vue",
-        "angular",
-        "svelte",
-        "gatsby",
-        "next",
-        "nuxt",
-        "hugo",
-        "jekyll",
-        "express",
-        "koa",
-        "fastify",
-        "django",
-        "flask",
-        "fastapi",
-        "rails",
-        "sinatra",
-        "laravel",
-        "symfony",
-    ]
-    has_web_framework = any(
-        framework in str(deps).lower()
-        for deps in dependencies.values()
-        for framework in web_frameworks
-    )
+    deps_blob = _dependency_blob(dependencies)
+    if any(framework in deps_blob for framework in _WEB_FRAMEWORKS):
+        return True
 
-    # Check for typical website directory structure
-    structure = analysis_data.get("project_structure", {})
-    web_dirs = [
-        "public",
-        "static",
-        "assets",
-        "dist",
-        "build",
-        "www",
-        "html",
-        "css",
-        "js",
-        "images",
-        "img",
-    ]
-    has_web_dirs = any(any(web_dir in path.lower() for web_dir in web_dirs) for path in structure)
-
-    # Check for high HTML/CSS/JS content
-    web_languages = (
-        languages.get("html", 0) + languages.get("css", 0) + languages.get("javascript", 0)
-    )
-    total_files = sum(languages.values()) if languages else 1
+    # Check for high HTML/CSS/JS content, totalled in one pass
+    web_languages = 0
+    total_files = 0
+    for language, count in languages.items():
+        total_files += count
+        if language in _WEB_LANGUAGES:
+            web_languages += count
     web_ratio = web_languages / total_files if total_files > 0 else 0
 
-    # Website detection criteria
-    return (
-        has_html_entry
-        or has_static_generator
-        or has_web_framework
-        or (has_css and web_ratio > 0.3)
-        or (has_web_dirs and web_ratio > 0.2)
-    )
+    # Check for CSS files
+    if web_ratio > 0.3 and any(f.endswith(".css") for f in files):
+        return True
+    if web_ratio <= 0.2:
+        return False
+
+    # Check for typical website directory structure
+    structure = analysis_data.get("project_structure", {})
+    return any(any(web_dir in path.lower() for web_dir in _WEB_DIRS) for path in structure)
 
 
-def get_project_type(analysis_data: Dict[str, Any]) -> str:
+def get_project_type(analysis_data: Dict[str, Any], is_website: bool | None = None) -> str:
     """
     Determine the type of project based on analysis data.
 
     Args:
         analysis_data: Analysis results
+        is_website: Precomputed ``is_website_project`` result, if the caller has one
 
     Returns:
         Project type description
     """
     dependencies = analysis_data.get("dependencies", {})
     files = analysis_data.get("project_structure", {}).get("root", {}).get("files", [])
+    deps_blob = _dependency_blob(dependencies)
+    if is_website is None:
+        is_website = is_website_project(analysis_data)
 
     # First check if it's a website
-    if is_website_project(analysis_data):
+    if is_website:
         # Determine specific website type
         if "package.json" in files:
-            if any("react" in str(deps).lower() for deps in dependencies.values()):
+            if "react" in deps_blob:
                 return "React Website"
-            if any("vue" in str(deps).lower() for deps in dependencies.values()):
+            if "vue" in deps_blob:
                 return "Vue.js Website"
-            if any("angular" in str(deps).lower() for deps in dependencies.values()):
+            if "angular" in deps_blob:
                 return "Angular Website"
-            if any("gatsby" in str(deps).lower() for deps in dependencies.values()):
+            if "gatsby" in deps_blob:
                 return "Gatsby Static Website"
-            if any("next" in str(deps).lower() for deps in dependencies.values()):
+            if "next" in deps_blob:
                 return "Next.js Website"
             return "JavaScript Website"
-        if any(f in files for f in ["_config.yml", "hugo.toml", "hugo.yaml"]):
+        if not _HUGO_JEKYLL_CONFIGS.isdisjoint(files):
             return "Static Website (Hugo/Jekyll)"
-        if any("django" in str(deps).lower() for deps in dependencies.values()):
+        if "django" in deps_blob:
             return "Django Website"
-        if any("flask" in str(deps).lower() for deps in dependencies.values()):
+        if "flask" in deps_blob:
             return "Flask Website"
         return "Website"
 
     # Check for specific project types
     if "package.json" in files:
-        if any("react" in str(deps).lower() for deps in dependencies.values()):
+        if "react" in deps_blob:
             return "React Application"
-        if any("vue" in str(deps).lower() for deps in dependencies.values()):
+        if "vue" in deps_blob:
             return "Vue.js Application"
-        if any("angular" in str(deps).lower() for deps in dependencies.values()):
+        if "angular" in deps_blob:
             return "Angular Application"
-        if any("express" in str(deps).lower() for deps in dependencies.values()):
+        if "express" in deps_blob:
             return "Node.js/Express Application"
         return "Node.js Application"
 
     if "requirements.txt" in files or "pyproject.toml" in files or "setup.py" in files:
-        if any("django" in str(deps).lower() for deps in dependencies.values()):
+        if "django" in deps_blob:
             return "Django Application"
-        if any("flask" in str(deps).lower() for deps in dependencies.values()):
+        if "flask" in deps_blob:
             return "Flask Application"
-        if any("fastapi" in str(deps).lower() for deps in dependencies.values()):
+        if "fastapi" in deps_blob:
             return "FastAPI Application"
         return "Python Application"
 
@@ -536,16 +775,19 @@ def create_directory_tree(structure: Dict[str, Any], max_depth: int = 3) -> str:
             tree_lines.append(f"... and {len(root_info['files']) - 10} more files")
 
     # Add directories (limited depth)
+    indents = ["│   " * depth for depth in range(max_depth)]
     dirs_added = 0
     for path, info in structure.items():
-        if path == "root" or dirs_added >= 10:  # Limit directories shown
+        if dirs_added >= 10:  # Limit directories shown
+            break
+        if path == "root":
             continue
 
         depth = path.count(os.sep)
         if depth >= max_depth:
             continue
 
-        indent = "│   " * depth
+        indent = indents[depth]
         tree_lines.append(f"{indent}├── {os.path.basename(path)}/")
 
         # Add some files from this directory
@@ -29,6 +29,28 @@ def test_validate_format_and_extract_title() -> None:
     assert _extract_title("text\n## no") is None
 
 
+def test_invalid_markdown_backend_fails_before_analysis(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("DOCGENIE_MD_BACKEND", "mistune")
+
+    def fail_analysis(*_args: object, **_kwargs: object) -> dict:
+        raise AssertionError("analysis should not run")
+
+    monkeypatch.setattr(cli, "_run_analysis", fail_analysis)
+    runner = CliRunner()
+    result = runner.invoke(app, ["generate", str(tmp_path), "--format", "html"])
+    assert result.exit_code == 1
+    assert "Invalid DOCGENIE_MD_BACKEND" in result.stdout
+    assert result.exception is None or isinstance(result.exception, SystemExit)
+
+    readme = tmp_path / "README.md"
+    readme.write_text("# Sample\n", encoding="utf-8")
+    html_result = runner.invoke(app, ["html", str(readme), "--force"])
+    assert html_result.exit_code == 1
+    assert "Invalid DOCGENIE_MD_BACKEND" in html_result.stdout
+
+
 def test_output_resolution_helpers(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     base = tmp_path
     out_dir = tmp_path / "out"
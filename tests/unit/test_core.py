@@ -1,9 +1,11 @@
 """Tests for core analysis functionality."""
 
+import os
 from pathlib import Path
 
 import pytest
 
+from docgenie import core
 from docgenie.core import CacheManager, CodebaseAnalyzer, _hash_file
 
 
@@ -43,6 +45,103 @@ def test_cache_manager_lifecycle(tmp_path: Path) -> None:
     assert retrieved["language"] == "python"
 
 
+def test_cache_manager_persist_writes_only_new_entries(tmp_path: Path) -> None:
+    """Test that persisting writes one shard per new entry and leaves others alone."""
+    cache = CacheManager(tmp_path)
+    cache.persist()
+    assert not cache.entries_dir.exists()
+
+    cache.set(Path("a.py"), "hash-a", {"functions": []}, "python")
+    cache.set(Path("b.py"), "hash-b", {"functions": []}, "python")
+    cache.persist()
+    shards = sorted(cache.entries_dir.rglob("*.json"))
+    assert len(shards) == 2
+
+    shards[0].write_text("{}", encoding="utf-8")
+    cache.set(Path("c.py"), "hash-c", {"functions": []}, "python")
+    cache.persist()
+    assert shards[0].read_text(encoding="utf-8") == "{}"
+    assert len(list(cache.entries_dir.rglob("*.json"))) == 3
+
+
+def test_cache_manager_corrupted_entry_is_a_miss(tmp_path: Path) -> None:
+    """Test that an unreadable shard is treated as a cache miss."""
+    cache = CacheManager(tmp_path)
+    cache.set(Path("test.py"), "abc123", {"functions": []}, "python")
+    cache.persist()
+    next(cache.entries_dir.rglob("*.json")).write_bytes(b"\xff{{{")
+
+    assert CacheManager(tmp_path).get(Path("test.py"), "abc123") is None
+
+
+def test_cache_manager_flushes_oldest_entries_past_max(tmp_path: Path) -> None:
+    """Test that pending entries beyond max_entries are written out oldest first."""
+    cache = CacheManager(tmp_path, max_entries=2)
+    for name in ("a.py", "b.py", "c.py"):
+        cache.set(Path(name), f"hash-{name}", {"functions": [name]}, "python")
+
+    assert list(cache._data) == ["b.py", "c.py"]
+    assert len(list(cache.entries_dir.rglob("*.json"))) == 1
+    assert cache.get(Path("a.py"), "hash-a.py") == {"functions": ["a.py"], "language": "python"}
+
+    cache.persist()
+    reloaded = CacheManager(tmp_path)
+    assert all(reloaded.get(Path(n), f"hash-{n}") for n in ("a.py", "b.py", "c.py"))
+
+
+def test_cache_manager_matches_recorded_stat(tmp_path: Path) -> None:
+    """Test that entries stored with an old enough stat are found without a digest."""
+    source = tmp_path / "mod.py"
+    source.write_text("x = 1\n", encoding="utf-8")
+    os.utime(source, ns=(1_000_000_000, 1_000_000_000))
+    cache = CacheManager(tmp_path)
+    cache.set(source, "abc123", {"functions": []}, "python", source.stat())
+    cache.persist()
+
+    reloaded = CacheManager(tmp_path)
+    assert reloaded.get_unchanged(source, source.stat()) == {"functions": [], "language": "python"}
+    source.write_text("x = 22\n", encoding="utf-8")
+    os.utime(source, ns=(1_000_000_000, 1_000_000_000))
+    assert reloaded.get_unchanged(source, source.stat()) is None
+
+    # A file modified just now is only trusted after its digest is checked again
+    source.touch()
+    cache.set(source, "abc123", {"functions": []}, "python", source.stat())
+    assert cache.get_unchanged(source, source.stat()) is None
+    assert cache.get(source, "abc123") is not None
+
+
+def test_cache_manager_removes_legacy_monolithic_cache(tmp_path: Path) -> None:
+    """Test that the pre-sharding cache.json is deleted when the stamp is first written."""
+    legacy = tmp_path / ".docgenie" / "cache.json"
+    legacy.parent.mkdir()
+    legacy.write_text('{"test.py": {"hash": "abc123"}}', encoding="utf-8")
+
+    CacheManager(tmp_path)
+    assert not legacy.exists()
+
+
+def test_cache_manager_drops_entries_when_stamp_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a parser or grammar upgrade invalidates every stored entry."""
+    cache = CacheManager(tmp_path)
+    cache.set(Path("test.py"), "abc123", {"functions": []}, "python")
+    cache.persist()
+    assert CacheManager(tmp_path).get(Path("test.py"), "abc123") is not None
+    assert cache.stamp_file.read_text(encoding="utf-8").startswith("docgenie ")
+
+    monkeypatch.setattr(core, "_CACHE_SCHEMA_VERSION", core._CACHE_SCHEMA_VERSION + 1)
+    assert CacheManager(tmp_path).get(Path("test.py"), "abc123") is None
+    assert not cache.entries_dir.exists()
+
+    # Toggling tree-sitter changes parse results too
+    cache = CacheManager(tmp_path)
+    cache.set(Path("test.py"), "abc123", {"functions": []}, "python")
+    cache.persist()
+    assert CacheManager(tmp_path, enable_tree_sitter=False).get(Path("test.py"), "abc123") is None
+
+
 def test_cache_manager_invalidation(tmp_path: Path) -> None:
     """Test cache invalidation on hash mismatch."""
     cache = CacheManager(tmp_path)
@@ -154,6 +253,23 @@ def test_analyzer_caching(tmp_path: Path) -> None:
     assert len(result1["functions"]) == len(result2["functions"])
 
 
+def test_analyzer_skips_hashing_unchanged_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that warm runs trust size and mtime instead of rehashing."""
+    test_file = tmp_path / "module.py"
+    test_file.write_text("def cached_func(): pass", encoding="utf-8")
+    os.utime(test_file, ns=(1_000_000_000, 1_000_000_000))
+    CodebaseAnalyzer(str(tmp_path), enable_tree_sitter=False).analyze()
+
+    def no_hashing(_path: Path) -> str:
+        raise AssertionError("unchanged file was hashed")
+
+    monkeypatch.setattr(core, "_hash_file", no_hashing)
+    result = CodebaseAnalyzer(str(tmp_path), enable_tree_sitter=False).analyze()
+    assert [func["name"] for func in result["functions"]] == ["cached_func"]
+
+
 def test_analyzer_project_structure(tmp_path: Path) -> None:
     """Test project structure detection."""
     (tmp_path / "src").mkdir()
@@ -2,18 +2,20 @@ from __future__ import annotations
 
 import builtins
 import json
+import os
 from pathlib import Path
 
 import pytest
 
 from docgenie import core
-from docgenie.core import CodebaseAnalyzer, _analyze_file_task
+from docgenie.core import CodebaseAnalyzer, _analyze_batch, _analyze_file_task
+from docgenie.utils import DEFAULT_IGNORE_PATTERNS
 
 
 def test_analyze_file_task_handles_no_language_and_permission(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     unknown = tmp_path / "x.unknown"
     unknown.write_text("x", encoding="utf-8")
-    p, lang, parsed, digest = _analyze_file_task((str(unknown), [], False))
+    p, lang, parsed, digest = _analyze_file_task((str(unknown), [], False, "d"))
     assert p == str(unknown)
     assert lang == ""
     assert parsed is None
@@ -26,12 +28,46 @@ def test_analyze_file_task_handles_no_language_and_permission(monkeypatch: pytes
         raise PermissionError("no")
 
     monkeypatch.setattr(builtins, "open", raise_perm)
-    p2, lang2, parsed2, digest2 = _analyze_file_task((str(py), [], False))
+    p2, lang2, parsed2, digest2 = _analyze_file_task((str(py), [], False, "d"))
     assert p2 == str(py)
     assert lang2 == "python"
     assert parsed2 is None
     assert digest2 == ""
 
+    monkeypatch.undo()
+    _, _, parsed3, digest3 = _analyze_file_task((str(py), [], False, "precomputed"))
+    assert parsed3 is not None
+    assert digest3 == "precomputed"
+
+
+def test_analyze_batch_shares_one_registry(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    paths = []
+    for name in ("a.py", "b.py", "c.unknown"):
+        path = tmp_path / name
+        path.write_text("def f():\n    return 1\n", encoding="utf-8")
+        paths.append(str(path))
+
+    created: list[bool] = []
+    real_registry = core.ParserRegistry
+
+    def counting_registry(*, enable_tree_sitter: bool = True):
+        created.append(enable_tree_sitter)
+        return real_registry(enable_tree_sitter=enable_tree_sitter)
+
+    monkeypatch.setattr(core, "ParserRegistry", counting_registry)
+    monkeypatch.setattr(core, "_WORKER_REGISTRIES", {})
+    results = _analyze_batch([(path, [], False, "d") for path in paths])
+
+    assert [result[0] for result in results] == paths
+    assert [result[1] for result in results] == ["python", "python", ""]
+    assert created == [False]
+
+    # Later batches and single-file tasks in the same process reuse the registry
+    _analyze_batch([(paths[0], [], False, "d")])
+    _analyze_file_task((paths[1], [], False, "d"))
+    assert created == [False]
+    assert _analyze_batch([]) == []
+
 
 def test_apply_parsed_data_unknown_language(tmp_path: Path) -> None:
     analyzer = CodebaseAnalyzer(str(tmp_path), enable_tree_sitter=False)
@@ -39,7 +75,11 @@ def test_apply_parsed_data_unknown_language(tmp_path: Path) -> None:
     target.write_text("x", encoding="utf-8")
     analyzer._apply_parsed_data({"functions": [], "classes": [], "imports": ["os"]}, target, None)
     assert analyzer.languages["unknown"] == 1
-    assert analyzer.imports["unknown"] == {"os"}
+    assert analyzer.imports["unknown"] == ["os"]
+    analyzer._apply_parsed_data({"imports": ["sys", "os"]}, target, None)
+    compiled = analyzer._compile_results()
+    assert compiled.imports == {"unknown": ["os", "sys"]}
+    assert compiled.file_imports == {"file.noext": ["os", "sys"]}
 
 
 def test_iter_source_files_and_structure_ignore(tmp_path: Path) -> None:
@@ -54,6 +94,63 @@ def test_iter_source_files_and_structure_ignore(tmp_path: Path) -> None:
     assert "root" in analyzer.project_structure
 
 
+def test_project_structure_keeps_walk_order_and_shares_names(tmp_path: Path) -> None:
+    for pkg in ("a", "b"):
+        (tmp_path / pkg / "inner").mkdir(parents=True)
+        (tmp_path / pkg / "__init__.py").write_text("", encoding="utf-8")
+    analyzer = CodebaseAnalyzer(str(tmp_path), enable_tree_sitter=False)
+    analyzer._analyze_project_structure()
+    structure = analyzer.project_structure
+    walked = [os.path.relpath(root, tmp_path) for root, _dirs, _files in os.walk(tmp_path)]
+    expected = ["root" if rel == "." else rel for rel in walked if not rel.startswith(".docgenie")]
+    assert list(structure) == expected
+    assert structure["a"]["files"][0] is structure["b"]["files"][0]
+
+
+def test_analyze_walks_the_tree_once(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "mod.py").write_text("def f():\n    return 1\n", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("x", encoding="utf-8")
+    analyzer = CodebaseAnalyzer(str(tmp_path), enable_tree_sitter=False)
+
+    walks: list[int] = []
+    real_scan = analyzer._scan_tree
+
+    def counting_scan():
+        walks.append(1)
+        return real_scan()
+
+    monkeypatch.setattr(analyzer, "_scan_tree", counting_scan)
+    result = analyzer.analyze()
+
+    assert walks == [1]
+    assert result["project_structure"]["pkg"]["files"] == ["mod.py"]
+    assert analyzer.files_discovered == 2
+
+
+def test_scan_tree_prunes_heavy_dirs_by_name(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    assert core._FAST_IGNORE_DIRS <= set(DEFAULT_IGNORE_PATTERNS)
+    (tmp_path / "node_modules" / "lib").mkdir(parents=True)
+    (tmp_path / "node_modules" / "lib" / "index.js").write_text("x", encoding="utf-8")
+    (tmp_path / "app.py").write_text("pass", encoding="utf-8")
+    analyzer = CodebaseAnalyzer(str(tmp_path), enable_tree_sitter=False)
+
+    checked: list[str] = []
+    real_skip = analyzer._should_skip_path
+
+    def recording_skip(path: Path, *, is_dir: bool, entry: os.DirEntry[str] | None = None) -> bool:
+        checked.append(path.name)
+        return real_skip(path, is_dir=is_dir, entry=entry)
+
+    monkeypatch.setattr(analyzer, "_should_skip_path", recording_skip)
+    files = analyzer._scan_tree()
+
+    assert [(f.name, stat.st_size) for f, stat in files] == [("app.py", 4)]
+    assert "node_modules" not in checked
+    assert analyzer.project_structure["root"]["dirs"] == []
+    assert analyzer.skipped_reasons["ignore_pattern"] == 1
+
+
 def test_iter_source_files_honors_gitignore_generated_hidden_and_size(tmp_path: Path) -> None:
     (tmp_path / ".gitignore").write_text("ignored_dir/\nignored.py\n", encoding="utf-8")
     (tmp_path / "ignored.py").write_text("def x(): pass\n", encoding="utf-8")
@@ -123,6 +220,10 @@ def test_dependency_parsers_and_detect_dependencies(tmp_path: Path, monkeypatch:
     pkg = tmp_path / "package.json"
     pkg.write_text(json.dumps({"dependencies": {"react": "1"}, "devDependencies": {"vite": "1"}}), encoding="utf-8")
     assert analyzer._parse_package_json(pkg) == {"dependencies": ["react"], "devDependencies": ["vite"]}
+    pkg.write_bytes(b'\xef\xbb\xbf{"dependencies": {"react": "1"}, "devDependencies": []}')
+    assert analyzer._parse_package_json(pkg) == {"dependencies": ["react"]}
+    pkg.write_text("[]", encoding="utf-8")
+    assert analyzer._parse_package_json(pkg) == {}
 
     pyproject = tmp_path / "pyproject.toml"
     pyproject.write_text(
@@ -138,6 +239,8 @@ def test_dependency_parsers_and_detect_dependencies(tmp_path: Path, monkeypatch:
     setup = tmp_path / "setup.py"
     setup.write_text("install_requires=['a>=1','b']", encoding="utf-8")
     assert analyzer._parse_setup_py(setup) == ["a", ",", "b"]
+    setup.write_text("install_requires = [\n    'caf\u00e9>=1',\n    \"b\",\n]\nx = ['c']", encoding="utf-8")
+    assert analyzer._parse_setup_py(setup) == ["caf\u00e9", ",\n    ", "b", ",\n"]
     setup.write_text("print('no deps')", encoding="utf-8")
     assert analyzer._parse_setup_py(setup) == []
 
@@ -152,6 +255,8 @@ def test_dependency_parsers_and_detect_dependencies(tmp_path: Path, monkeypatch:
     pom = tmp_path / "pom.xml"
     pom.write_text("<artifactId>a</artifactId><artifactId>b</artifactId>", encoding="utf-8")
     assert analyzer._parse_pom_xml(pom) == ["a", "b"]
+    pom.write_text("<artifactId>caf\u00e9</artifactId>\n<artifactId>\nsplit</artifactId>", encoding="utf-8")
+    assert analyzer._parse_pom_xml(pom) == ["caf\u00e9"]
 
     gem = tmp_path / "Gemfile"
     gem.write_text("gem 'rails'\nsource 'x'\n", encoding="utf-8")
@@ -160,9 +265,15 @@ def test_dependency_parsers_and_detect_dependencies(tmp_path: Path, monkeypatch:
     # Malformed dependency file should be ignored in _detect_dependencies exception path.
     bad_pkg = tmp_path / "package.json"
     bad_pkg.write_text("{not json", encoding="utf-8")
+    pom.write_bytes(b"")
+    cargo.write_text("[dependencies\nserde = '1'\n", encoding="utf-8")
     analyzer._detect_dependencies()
     assert "requirements.txt" in analyzer.dependencies
     assert "package.json" not in analyzer.dependencies
+    assert "pom.xml" not in analyzer.dependencies
+    assert "Cargo.toml" not in analyzer.dependencies
+    # Manifests parse concurrently but are recorded in the fixed manifest order
+    assert list(analyzer.dependencies) == ["requirements.txt", "pyproject.toml", "go.mod", "Gemfile"]
 
     def broken_parser(_path: Path):
         raise ValueError("broken")
@@ -171,32 +282,61 @@ def test_dependency_parsers_and_detect_dependencies(tmp_path: Path, monkeypatch:
     analyzer.dependencies.clear()
     analyzer._detect_dependencies()
     assert isinstance(analyzer.dependencies, dict)
+    assert "Gemfile" not in analyzer.dependencies
 
 
 def test_analyze_with_mocked_process_pool(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    (tmp_path / "a.py").write_text("def f():\n    return 1\n", encoding="utf-8")
+    for name in ("a", "b", "c", "d"):
+        (tmp_path / f"{name}.py").write_text(f"def {name}():\n    return 1\n", encoding="utf-8")
     analyzer = CodebaseAnalyzer(str(tmp_path), enable_tree_sitter=False)
-
-    class DummyFuture:
-        def __init__(self, result):
-            self._result = result
-
-        def result(self):
-            return self._result
+    pools: list[int] = []
 
     class DummyExecutor:
+        def __init__(self, max_workers=None, initializer=None, initargs=()):
+            pools.append(max_workers)
+            initializer(*initargs)
+
         def __enter__(self):
             return self
 
         def __exit__(self, *_args):
             return False
 
-        def submit(self, fn, payload):
-            return DummyFuture(fn(payload))
+        def map(self, fn, payloads, chunksize=1):
+            assert chunksize >= 1
+            return [fn(payload) for payload in payloads]
 
     monkeypatch.setattr(core, "ProcessPoolExecutor", DummyExecutor)
-    monkeypatch.setattr(core, "as_completed", lambda futures: list(futures.keys()))
+    monkeypatch.setattr(core, "_WORKER_REGISTRIES", {})
 
     result = analyzer.analyze()
-    assert result["files_analyzed"] >= 1
+    assert result["files_analyzed"] >= 4
+    assert [func["name"] for func in result["functions"]] == ["a", "b", "c", "d"]
+    assert list(core._WORKER_REGISTRIES) == [False]
+    assert pools and 1 <= pools[0] <= (os.cpu_count() or 1)
+
+
+def test_analyze_runs_few_files_inline(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    (tmp_path / "a.py").write_text("def f():\n    return 1\n", encoding="utf-8")
+
+    def no_pool(*_args, **_kwargs):
+        raise AssertionError("process pool started for a single file")
+
+    monkeypatch.setattr(core, "ProcessPoolExecutor", no_pool)
+    result = CodebaseAnalyzer(str(tmp_path), enable_tree_sitter=False).analyze()
+    assert [func["name"] for func in result["functions"]] == ["f"]
     assert result["website_detection_reason"]
+
+
+def test_analyze_passes_contributor_setting_to_git_info(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    calls: list[bool] = []
+
+    def fake_git_info(_path: Path, *, include_contributors: bool = False) -> dict[str, object]:
+        calls.append(include_contributors)
+        return {}
+
+    monkeypatch.setattr(core, "extract_git_info", fake_git_info)
+    CodebaseAnalyzer(str(tmp_path), enable_tree_sitter=False).analyze()
+    config = {"analysis": {"include_contributors": False}}
+    CodebaseAnalyzer(str(tmp_path), enable_tree_sitter=False, config=config).analyze()
+    assert calls == [True, False]
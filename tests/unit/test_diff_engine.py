@@ -4,7 +4,8 @@ from pathlib import Path
 
 from git import Repo
 
-from docgenie.diff_engine import compute_git_diff_summary
+from docgenie.diff_engine import _symbol_count, compute_git_diff_summary
+from docgenie.parsers import ParserRegistry
 
 
 def test_diff_engine_non_git(tmp_path: Path) -> None:
@@ -27,3 +28,20 @@ def test_diff_engine_basic_git(tmp_path: Path) -> None:
     assert summary["available"] is True
     assert summary["totals"]["modified"] >= 1
     assert summary["files"][0]["path"] == "main.py"
+
+
+def test_symbol_count_memoizes_identical_content() -> None:
+    calls: list[str] = []
+    registry = ParserRegistry(enable_tree_sitter=False)
+    original_parse = registry.parse
+
+    def counting_parse(content: str, path: Path, language: str):
+        calls.append(str(path))
+        return original_parse(content, path, language)
+
+    registry.parse = counting_parse  # type: ignore[method-assign]
+    memo: dict[tuple[str, bytes], int] = {}
+    source = "def a():\n    return 1\n"
+    assert _symbol_count(source, "old/a.py", registry, memo) == 1
+    assert _symbol_count(source, "new/a.py", registry, memo) == 1
+    assert calls == ["old/a.py"]
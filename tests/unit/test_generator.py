@@ -5,6 +5,7 @@ from pathlib import Path
 
 import pytest
 
+from docgenie import generator
 from docgenie.generator import ReadmeGenerator
 
 
@@ -170,3 +171,136 @@ def test_readme_respects_include_api_docs(sample_analysis: dict) -> None:
     content = generator.generate(data, None)
 
     assert "## API Reference" not in content
+
+
+def test_generators_share_compiled_template(sample_analysis: dict) -> None:
+    """Test that the README template is compiled once and reused."""
+    first = ReadmeGenerator()
+    second = ReadmeGenerator()
+    assert first.template is second.template
+    stamp = "2024-01-01 00:00:00"
+    assert first.generate(copy.deepcopy(sample_analysis), None, stamp) == second.generate(
+        copy.deepcopy(sample_analysis), None, stamp
+    )
+
+
+def test_template_compiles_without_bytecode_cache(
+    sample_analysis: dict, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that an unusable bytecode cache directory falls back to in-memory compilation."""
+
+    def unsafe_cache() -> None:
+        raise RuntimeError("Cannot determine safe temp directory.")
+
+    stamp = "2024-01-01 00:00:00"
+    expected = ReadmeGenerator().generate(copy.deepcopy(sample_analysis), None, stamp)
+    monkeypatch.setattr(generator, "FileSystemBytecodeCache", unsafe_cache)
+    generator._compiled_readme_template.cache_clear()
+    try:
+        rendered = ReadmeGenerator().generate(copy.deepcopy(sample_analysis), None, stamp)
+        assert rendered == expected
+    finally:
+        generator._compiled_readme_template.cache_clear()
+
+
+def test_dependency_strings_lowered_once(
+    sample_analysis: dict, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that dependency keyword heuristics share one lower-cased copy per render."""
+    calls = []
+    original = generator._dependency_strings
+
+    def counting(dependencies: dict) -> tuple[str, ...]:
+        calls.append(dependencies)
+        return original(dependencies)
+
+    monkeypatch.setattr(generator, "_dependency_strings", counting)
+    data = copy.deepcopy(sample_analysis)
+    data["dependencies"] = {"package.json": {"dependencies": {"React": "^18", "parcel": "2"}}}
+    data["project_structure"]["root"]["files"].append("index.html")
+    content = ReadmeGenerator().generate(data)
+
+    assert len(calls) == 1
+    assert "built with React" in content
+
+
+def test_project_classification_computed_once(
+    sample_analysis: dict, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that website detection and naming run once per generated README."""
+    calls = {"website": 0, "name": 0}
+    original_website = generator.is_website_project
+    original_name = ReadmeGenerator._get_project_name
+
+    def counting_website(data: dict) -> bool:
+        calls["website"] += 1
+        return original_website(data)
+
+    def counting_name(self: ReadmeGenerator, data: dict) -> str:
+        calls["name"] += 1
+        return original_name(self, data)
+
+    monkeypatch.setattr(generator, "is_website_project", counting_website)
+    monkeypatch.setattr(ReadmeGenerator, "_get_project_name", counting_name)
+    data = copy.deepcopy(sample_analysis)
+    data["classes"][0]["name"] = "Runner"
+    ReadmeGenerator().generate(data, str(tmp_path / "README.md"))
+
+    assert calls == {"website": 1, "name": 1}
+
+
+def test_unrendered_sections_are_not_computed(
+    sample_analysis: dict, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that usage examples and the API quality gate are skipped when not rendered."""
+
+    def fail(*_args: object) -> None:
+        raise AssertionError("section should not be computed")
+
+    data = copy.deepcopy(sample_analysis)
+    data["config"] = {"template_customizations": {"include_api_docs": False}}
+    monkeypatch.setattr(ReadmeGenerator, "_build_quality_report", fail)
+    context = ReadmeGenerator()._prepare_context(data)
+    assert context["api_docs"] == {"functions": [], "classes": []}
+    assert context["usage_examples"]
+
+    website = copy.deepcopy(sample_analysis)
+    website["project_structure"]["root"]["files"].append("index.html")
+    monkeypatch.setattr(ReadmeGenerator, "_generate_usage_examples", fail)
+    context = ReadmeGenerator()._prepare_context(website)
+    assert context["is_website"]
+    assert context["usage_examples"] == []
+
+
+def test_generate_uses_supplied_timestamp(sample_analysis: dict) -> None:
+    """Test that a caller-supplied generation date is stamped as is."""
+    content = ReadmeGenerator().generate(
+        copy.deepcopy(sample_analysis), None, "2024-05-06 07:08:09"
+    )
+    assert "on 2024-05-06 07:08:09*" in content
+
+
+def test_project_facts_reused_until_a_section_is_replaced(
+    sample_analysis: dict, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that repeated renders of one analysis reuse derived facts until it changes."""
+    calls = []
+    original = generator.is_website_project
+
+    def counting(data: dict) -> bool:
+        calls.append(data)
+        return original(data)
+
+    monkeypatch.setattr(generator, "is_website_project", counting)
+    gen = ReadmeGenerator()
+    data = copy.deepcopy(sample_analysis)
+    gen.generate(data)
+    data["readme_readiness"] = {"status": "pass", "score": 90}
+    gen.generate(data)
+    assert len(calls) == 1
+
+    data["dependencies"] = {"package.json": {"dependencies": ["react"]}}
+    data["project_structure"] = {"root": {"files": ["index.html"], "dirs": []}}
+    content = gen.generate(data)
+    assert len(calls) == 2
+    assert "built with React" in content
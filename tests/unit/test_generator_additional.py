@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from docgenie import generator
 from docgenie.generator import ReadmeGenerator
 
 
@@ -292,3 +293,64 @@ def test_generator_redaction_and_package_docs(tmp_path: Path) -> None:
     artifacts = gen.generate_package_docs(analysis2, tmp_path / ".docgenie" / "packages")
     assert "pkg-a" in artifacts
     assert (tmp_path / ".docgenie" / "packages" / "pkg-a" / "README.md").exists()
+
+
+def test_dependency_keywords_match_inside_package_names() -> None:
+    gen = ReadmeGenerator()
+    analysis = _base()
+    analysis["dependencies"] = {"requirements.txt": ["Flask-SQLAlchemy", "pytest-cov"]}
+    features = gen._extract_features(analysis)
+    assert features[:2] == ["Database integration", "Comprehensive testing"]
+    assert "data analysis tool" not in gen._generate_description(analysis)
+
+
+def test_has_tests_matches_keywords_within_single_paths() -> None:
+    gen = ReadmeGenerator()
+    assert gen._has_tests({"project_structure": {"src/Specs": {}, "root": {"files": []}}})
+    assert gen._has_tests({"project_structure": {"root": {"files": ["README.md", "TESTING.md"]}}})
+    # Keywords split across neighbouring names must not match
+    assert not gen._has_tests({"project_structure": {"root": {"files": ["te", "st.py"]}}})
+    assert not gen._has_tests({"project_structure": {"root": {"files": ["spec.md"]}}})
+
+
+def test_template_options_read_once_with_defaults() -> None:
+    gen = ReadmeGenerator()
+    funcs = [{"name": f"f{i}"} for i in range(12)]
+    assert len(gen._generate_api_docs(funcs, [], {"template_customizations": "bad"})["functions"]) == 10
+
+    analysis = _base()
+    analysis["functions"] = funcs
+    analysis["config"] = {"template_customizations": {"max_functions_documented": 3}}
+    assert len(gen._prepare_context(analysis)["api_docs"]["functions"]) == 3
+
+
+def test_website_asset_dirs_stop_at_limit() -> None:
+    gen = ReadmeGenerator()
+    analysis = _base()
+    analysis["project_structure"] = {
+        "root": {"files": ["index.html"], "dirs": []},
+        "src": {},
+        **{f"public/img{i}": {} for i in range(8)},
+    }
+    info = gen._get_website_info(analysis)
+    assert info["asset_directories"] == [f"public/img{i}" for i in range(5)]
+
+
+def test_api_docs_negative_function_limit_slices_like_a_list() -> None:
+    gen = ReadmeGenerator()
+    funcs = [{"name": name} for name in ("a", "_b", "c", "d")]
+    config = {"template_customizations": {"max_functions_documented": -1}}
+    api = gen._generate_api_docs(funcs, [], config)
+    assert [f["name"] for f in api["functions"]] == ["a", "c"]
+
+
+def test_template_options_share_defaults_when_nothing_is_customized() -> None:
+    default = generator._TemplateOptions.from_config({})
+    assert default is generator._TemplateOptions.from_config(
+        {"template_customizations": {"template_profile": "pro"}}
+    )
+    custom = generator._TemplateOptions.from_config(
+        {"template_customizations": {"include_api_docs": False}}
+    )
+    assert custom is not default
+    assert not custom.include_api_docs
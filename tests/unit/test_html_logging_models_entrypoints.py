@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import os
 import runpy
+import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -19,6 +23,22 @@ def test_public_metadata_exports() -> None:
     assert __email__
 
 
+def test_package_exports_are_imported_lazily() -> None:
+    probe = (
+        "import sys, docgenie; "
+        "assert 'docgenie.core' not in sys.modules; "
+        "assert docgenie.CodebaseAnalyzer.__module__ == 'docgenie.core'; "
+        "assert docgenie.ReadmeGenerator.__module__ == 'docgenie.generator'"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, "-c", probe], check=True, env=env)
+
+    import docgenie
+
+    with pytest.raises(AttributeError):
+        _ = docgenie.NotAnExport
+
+
 def test_models_public_dict_roundtrip() -> None:
     method = MethodDoc(name="m", file=Path("a.py"), line=3, docstring=None, args=["self"])
     func = FunctionDoc(name="f", file=Path("a.py"), line=1, docstring="doc", args=["x"])
@@ -157,3 +177,88 @@ def test_entrypoints(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(sys, "argv", ["docgenie-html", "--help"])
     with pytest.raises(SystemExit):
         runpy.run_module("docgenie.convert_to_html", run_name="__main__")
+
+
+def test_html_generator_reuses_converted_markdown(monkeypatch: pytest.MonkeyPatch) -> None:
+    gen = HTMLGenerator()
+    first = gen.generate_from_readme("# Title\n\n## Usage\n", None, "A")
+    assert 'href="#usage"' in first
+
+    def fail(_source: str) -> str:
+        raise AssertionError("markdown should not be converted again")
+
+    monkeypatch.setattr(gen.markdown_processor, "convert", fail)
+    second = gen.generate_from_readme("# Title\n\n## Usage\n", None, "B")
+    assert second.replace(">B<", ">A<") == first.replace(">B<", ">A<")
+
+    monkeypatch.undo()
+    blank = gen.generate_from_readme("   ", None, "C")
+    assert 'href="#usage"' not in blank
+
+
+def test_html_generator_resets_its_markdown_processor_between_documents() -> None:
+    gen = HTMLGenerator()
+    processor = gen.markdown_processor
+    gen.generate_from_readme("# One\n\n## Alpha\n", None, "P")
+    html = gen.generate_from_readme("# Two\n\n## Beta\n", None, "P")
+    assert gen.markdown_processor is processor
+    assert 'href="#beta"' in html
+    assert 'href="#alpha"' not in html
+
+
+def test_html_generators_render_independently_on_separate_threads() -> None:
+    generators = [HTMLGenerator(), HTMLGenerator()]
+    assert generators[0].markdown_processor is not generators[1].markdown_processor
+    barrier = threading.Barrier(len(generators))
+
+    def render(index: int) -> list[str]:
+        gen = generators[index]
+        barrier.wait()
+        pages = []
+        for round_number in range(50):
+            source = f"# Doc {index}\n\n## Part {index} {round_number}\n\n" * 20
+            pages.append(gen._convert_markdown(source)[1])
+        return pages
+
+    with ThreadPoolExecutor(max_workers=len(generators)) as pool:
+        results = list(pool.map(render, range(len(generators))))
+    for index, tocs in enumerate(results):
+        other = 1 - index
+        assert all(f'href="#doc-{other}' not in toc for toc in tocs)
+        assert all(f'href="#doc-{index}"' in toc for toc in tocs)
+
+
+def test_markdown_it_backend_matches_python_markdown_toc_and_highlighting() -> None:
+    source = (
+        "# Title `x`\n\n## Usage\n\n```python\nprint('hi')\n```\n\n"
+        "### Deep\n\n## Usage\n\n| a | b |\n|---|---|\n| 1 | 2 |\n"
+    )
+    default_body, default_toc = HTMLGenerator()._convert_markdown(source)
+    fast_body, fast_toc = HTMLGenerator("markdown-it")._convert_markdown(source)
+    assert fast_toc == default_toc
+    assert '<h2 id="usage_1">Usage<a class="headerlink" href="#usage_1"' in fast_body
+    assert '<div class="highlight"><pre><span></span><code><span class="nb">print' in fast_body
+    assert "<td>2</td>" in fast_body
+    assert fast_body.replace("\n", "") == default_body.replace("\n", "")
+
+    for heading in ("# Title & <b>B</b>\n", "## ![logo](logo.png) Pic\n", "", "  \n\t\n"):
+        assert HTMLGenerator("markdown-it")._convert_markdown(heading)[1] == (
+            HTMLGenerator()._convert_markdown(heading)[1]
+        )
+
+
+def test_markdown_backend_comes_from_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DOCGENIE_MD_BACKEND", "markdown-it")
+    assert HTMLGenerator().markdown_backend == "markdown-it"
+    assert HTMLGenerator("markdown").markdown_backend == "markdown"
+    with pytest.raises(ValueError, match="mistune"):
+        HTMLGenerator("mistune")
+
+
+def test_generate_many_renders_documents_in_order(tmp_path: Path) -> None:
+    gen = HTMLGenerator()
+    items = [(f"# Doc {i}\n\n## Part {i}\n", str(tmp_path / f"{i}.html"), f"P{i}") for i in range(5)]
+    pages = gen.generate_many(items, max_workers=2)
+    assert pages == [gen.generate_from_readme(*item) for item in items]
+    assert 'href="#part-3"' in (tmp_path / "3.html").read_text(encoding="utf-8")
+    assert gen.generate_many(items[:1]) == pages[:1]
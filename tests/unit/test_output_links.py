@@ -25,3 +25,13 @@ def test_scan_output_links_marks_unresolved(tmp_path: Path) -> None:
     assert links
     assert links[0]["target_file"] is None
     assert links[0]["resolved"] is False
+
+
+def test_scan_output_links_prunes_ignored_directories(tmp_path: Path) -> None:
+    vendored = tmp_path / "node_modules" / "pkg"
+    vendored.mkdir(parents=True)
+    (vendored / "index.js").write_text("fs.writeFileSync('vendor.txt', 'x')\n", encoding="utf-8")
+    (tmp_path / "app.js").write_text("fs.writeFileSync('app.txt', 'x')\n", encoding="utf-8")
+
+    links = scan_output_links(tmp_path)
+    assert [link["source_file"] for link in links] == ["app.js"]
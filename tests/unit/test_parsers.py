@@ -35,3 +35,19 @@ def test_regex_parser_handles_js_functions(tmp_path: Path) -> None:
     names = {func.name for func in parsed.functions}
     assert {"App", "helper"} <= names
     assert "react" in {imp.lower() for imp in parsed.imports}
+
+
+def test_parse_files_fans_out_across_workers(tmp_path: Path) -> None:
+    py_file = tmp_path / "a.py"
+    py_file.write_text("def foo():\n    return 1\n", encoding="utf-8")
+    js_file = tmp_path / "b.js"
+    js_file.write_text("function bar() { return 2; }\n", encoding="utf-8")
+    unknown = tmp_path / "c.unknown"
+    unknown.write_text("ignored", encoding="utf-8")
+
+    registry = ParserRegistry(enable_tree_sitter=False)
+    results = registry.parse_files([py_file, js_file, unknown], max_workers=2)
+
+    assert set(results) == {py_file, js_file}
+    assert [func.name for func in results[py_file].functions] == ["foo"]
+    assert [func.name for func in results[js_file].functions] == ["bar"]
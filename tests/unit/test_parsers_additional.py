@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import ast
+import pickle
 from pathlib import Path
 
 import pytest
@@ -62,6 +63,23 @@ def test_regex_parser_for_other_languages() -> None:
     assert any(func.name == "main" for func in c_parsed.functions)
 
 
+def test_regex_parser_reports_line_numbers_for_prescanned_lines() -> None:
+    parser = parsers.RegexParser()
+    content = (
+        "// header\r\n"
+        "\r\n"
+        "import { a } from './a';\r\n"
+        "const x = 1;\n"
+        "class Widget {}\n"
+        "\n"
+        "function last() { return x; }"
+    )
+    parsed = parser.parse(content, Path("w.js"), "javascript")
+    assert [(f.name, f.line) for f in parsed.functions] == [("last", 7)]
+    assert [(c.name, c.line) for c in parsed.classes] == [("Widget", 5)]
+    assert parsed.imports == {"./a"}
+
+
 def test_language_pattern_helpers_cover_unknown() -> None:
     assert parsers._language_patterns("unknown").functions == ()
     assert parsers._function_nodes("unknown") == set()
@@ -80,6 +98,16 @@ def test_extract_name_and_helper_fallbacks() -> None:
             return Named() if field == "name" else None
 
     assert parsers._extract_name(NodeWithName(), "name") == "name"
+
+    class MultiByteName:
+        start_byte = 3
+        end_byte = 6
+
+    class NodeAfterMultiByte:
+        def child_by_field_name(self, field: str):
+            return MultiByteName() if field == "name" else None
+
+    assert parsers._extract_name(NodeAfterMultiByte(), "ñ foo".encode()) == "foo"
     assert parsers._extract_name(object(), "name") is None
 
     attr = ast.Attribute(value=ast.Name(id="obj"), attr="call")
@@ -228,6 +256,41 @@ def test_tree_sitter_parser_and_registry(monkeypatch: pytest.MonkeyPatch) -> Non
     assert registry.resolve("python") is not None
 
 
+def test_tree_sitter_parser_reuses_language_parser(monkeypatch: pytest.MonkeyPatch) -> None:
+    class EmptyCursor:
+        node = type("N", (), {"type": "module"})()
+
+        def goto_first_child(self) -> bool:
+            return False
+
+        def goto_next_sibling(self) -> bool:
+            return False
+
+        def goto_parent(self) -> bool:
+            return False
+
+    class Parser:
+        def parse(self, _bytes: bytes):
+            root = type("Root", (), {"walk": lambda _self: EmptyCursor()})()
+            return type("Tree", (), {"root_node": root})()
+
+    built: list[str] = []
+
+    def fake_get_parser(language: str) -> Parser:
+        built.append(language)
+        return Parser()
+
+    monkeypatch.setattr(parsers, "ts_get_parser", fake_get_parser)
+    parser = parsers.TreeSitterParser()
+    parser.parse("", Path("a.py"), "python")
+    parser.parse("", Path("b.py"), "python")
+    parser.parse("", Path("c.go"), "go")
+    assert built == ["python", "go"]
+
+    clone = pickle.loads(pickle.dumps(parser))
+    assert clone._parsers == {}
+
+
 def test_external_plugin_loader_variants(monkeypatch: pytest.MonkeyPatch) -> None:
     plugin = DummyPlugin(name="ext", languages={"python"})
 
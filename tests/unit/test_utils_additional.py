@@ -7,6 +7,11 @@ import pytest
 from docgenie import utils
 
 
+@pytest.fixture(autouse=True)
+def _fresh_git_info_cache() -> None:
+    utils.clear_git_info_cache()
+
+
 def test_get_file_language_unknown() -> None:
     assert utils.get_file_language(Path("README.unknownext")) is None
 
@@ -17,6 +22,27 @@ def test_should_ignore_file_with_additional_pattern() -> None:
     assert not utils.should_ignore_file("src/main.keep", ["*.cache"])
 
 
+def test_compile_ignore_patterns_matches_should_ignore_file() -> None:
+    paths = ["src/notes.cache", "src/main.py", "web/node_modules/x.js", "src/app/main.py", "a.pyc"]
+    for patterns in (None, ["*.cache"], ["src/*", "generated"]):
+        is_ignored = utils.compile_ignore_patterns(patterns)
+        assert [is_ignored(p) for p in paths] == [utils.should_ignore_file(p, patterns) for p in paths]
+
+
+def test_should_ignore_file_matches_whole_path_and_segments() -> None:
+    assert utils.should_ignore_file("pkg/module.pyc")
+    assert utils.should_ignore_file("web/node_modules/lib/index.js")
+    assert utils.should_ignore_file("src/app/main.py", ["src/*"])
+    assert not utils.should_ignore_file("src/environment.py")
+
+
+def test_should_ignore_dir_checks_name_only() -> None:
+    assert utils.should_ignore_dir("node_modules")
+    assert utils.should_ignore_dir("docgenie.egg-info")
+    assert utils.should_ignore_dir("generated", ["generated"])
+    assert not utils.should_ignore_dir("src")
+
+
 def test_gitignore_and_generated_helpers(tmp_path: Path) -> None:
     (tmp_path / ".gitignore").write_text("ignored_dir/\n*.secret\n", encoding="utf-8")
     matcher = utils.load_gitignore_spec(tmp_path)
@@ -212,24 +238,16 @@ def test_create_directory_tree_limits_and_empty() -> None:
 
 
 def test_extract_git_info_happy_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    class DummyAuthor:
-        name = "A"
-        email = "a@example.com"
-
-    class DummyCommit:
-        hexsha = "abc"
-        author = DummyAuthor()
-        committed_datetime = "2026-01-01"
-        message = "msg\n"
-
     class DummyOrigin:
         url = "https://github.com/org/repo.git"
 
     class DummyHead:
         is_detached = False
-        commit = DummyCommit()
 
     class DummyGit:
+        def log(self, *_args: object) -> str:
+            return "abc\x00A\x00a@example.com\x002026-01-01T10:00:00+02:00\x00msg\n"
+
         def shortlog(self, *_args: object) -> str:
             return "1\tA\n2\tB"
 
@@ -243,11 +261,18 @@ def test_extract_git_info_happy_path(monkeypatch: pytest.MonkeyPatch, tmp_path:
             _ = search_parent_directories
 
     monkeypatch.setattr(utils, "Repo", DummyRepo)
-    info = utils.extract_git_info(tmp_path)
+    info = utils.extract_git_info(tmp_path, include_contributors=True)
     assert info["repo_name"] == "org/repo"
     assert info["current_branch"] == "main"
-    assert info["latest_commit"]["hash"] == "abc"
+    assert info["latest_commit"] == {
+        "hash": "abc",
+        "author_name": "A",
+        "author_email": "a@example.com",
+        "date": "2026-01-01 10:00:00+02:00",
+        "message": "msg",
+    }
     assert info["contributor_count"] == 2
+    assert "contributor_count" not in utils.extract_git_info(tmp_path)
 
 
 def test_extract_git_info_handles_all_failures(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
@@ -263,7 +288,7 @@ def test_extract_git_info_handles_all_failures(monkeypatch: pytest.MonkeyPatch,
             raise utils.GitCommandError("branch", 1)
 
     monkeypatch.setattr(utils, "Repo", BadRepo)
-    assert isinstance(utils.extract_git_info(tmp_path), dict)
+    assert "contributor_count" not in utils.extract_git_info(tmp_path, include_contributors=True)
 
     class RaiseRepo:
         def __init__(self, _path: Path, search_parent_directories: bool = True) -> None:
@@ -271,3 +296,67 @@ def test_extract_git_info_handles_all_failures(monkeypatch: pytest.MonkeyPatch,
 
     monkeypatch.setattr(utils, "Repo", RaiseRepo)
     assert utils.extract_git_info(tmp_path) == {}
+
+
+@pytest.fixture
+def opened_repos(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """Replace ``Repo`` with a detached-head stub and record every path it opens."""
+    opened: list[Path] = []
+
+    class CountingRepo:
+        remotes = type("R", (), {})()
+        head = type("H", (), {"is_detached": True})()
+        git = type("G", (), {"shortlog": lambda *_a: ""})()
+
+        def __init__(self, path: Path, search_parent_directories: bool = True) -> None:
+            _ = search_parent_directories
+            opened.append(path)
+
+    monkeypatch.setattr(utils, "Repo", CountingRepo)
+    return opened
+
+
+def test_extract_git_info_is_cached_per_repo_path(opened_repos: list[Path], tmp_path: Path) -> None:
+    first = utils.extract_git_info(tmp_path)
+    first["mutated"] = True
+    assert utils.extract_git_info(tmp_path / ".") == {}
+    assert len(opened_repos) == 1
+
+    utils.clear_git_info_cache()
+    utils.extract_git_info(tmp_path)
+    assert len(opened_repos) == 2
+
+
+def test_extract_git_info_rereads_after_ref_update(
+    opened_repos: list[Path], tmp_path: Path
+) -> None:
+    git_dir = tmp_path / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+    branch = git_dir / "refs" / "heads" / "main"
+    branch.write_text("a" * 40 + "\n", encoding="utf-8")
+    (tmp_path / "src").mkdir()
+
+    utils.extract_git_info(tmp_path / "src")
+    utils.extract_git_info(tmp_path / "src")
+    assert len(opened_repos) == 1
+
+    # A commit moves the branch tip by renaming a lock file over the ref
+    lock = branch.with_suffix(".lock")
+    lock.write_text("b" * 40 + "\n", encoding="utf-8")
+    lock.replace(branch)
+    utils.extract_git_info(tmp_path / "src")
+    assert len(opened_repos) == 2
+
+    (git_dir / "HEAD").write_text("ref: refs/heads/feature\n", encoding="utf-8")
+    utils.extract_git_info(tmp_path / "src")
+    assert len(opened_repos) == 3
+
+
+def test_dependency_text_flattens_groups_without_repr_noise() -> None:
+    assert utils.dependency_text(["React", "vue"]) == "React\nvue"
+    assert utils.dependency_text({"dependencies": ["next"], "devDependencies": []}) == (
+        "dependencies\nnext\ndevDependencies\n"
+    )
+    assert utils.dependency_text({"extras": {"docs": ("mkdocs", 1)}}) == "extras\ndocs\nmkdocs\n1"
+    assert utils.dependency_text("plain") == "plain"
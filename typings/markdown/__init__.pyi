@@ -7,3 +7,4 @@ class Markdown:
 
     def __init__(self, *args: Any, **kwargs: Any) -> None: ...
     def convert(self, source: str) -> str: ...
+    def reset(self) -> Markdown: ...
@@ -0,0 +1,5 @@
+from __future__ import annotations
+
+from typing import Any
+
+def highlight(code: str, lexer: Any, formatter: Any, outfile: Any = None) -> Any: ...
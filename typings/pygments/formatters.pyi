@@ -0,0 +1,6 @@
+from __future__ import annotations
+
+from typing import Any
+
+class HtmlFormatter:
+    def __init__(self, **options: Any) -> None: ...
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from typing import Any
+
+class TextLexer:
+    def __init__(self, **options: Any) -> None: ...
+
+def get_lexer_by_name(_alias: str, **options: Any) -> Any: ...
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from typing import IO, Any
+
+class TOMLDecodeError(ValueError): ...
+
+def load(fp: IO[bytes]) -> dict[str, Any]: ...
+def loads(s: str) -> dict[str, Any]: ...